@@ -11,14 +11,140 @@ browser automation, since we cannot register an Entra app for API access.
 """
 
 import asyncio
+import json
 import logging
 import os
+import re
+from collections import deque
+from pathlib import Path
+from urllib.parse import urlparse
 from playwright.async_api import Page, BrowserContext, Browser, async_playwright
 
 logger = logging.getLogger(__name__)
 
-# Directory to save debug screenshots
-SCREENSHOT_DIR = os.path.join(os.path.dirname(__file__), "debug_screenshots")
+# URL patterns for the SSO hops, matched via Playwright's native
+# navigation events rather than injected-JS polling.
+ENTRA_HOSTS_RE = re.compile(r"microsoftonline|login\.microsoft|login\.live|tdsb")
+# Microsoft login hosts only — no 'tdsb', which would also match the
+# tdsb.elearningontario.ca host itself.
+MS_LOGIN_RE = re.compile(r"microsoftonline|login\.microsoft|login\.live")
+
+
+def _sso_done(url: str) -> bool:
+    """True when *url*'s hostname is a final SSO destination.
+
+    Anchored to the hostname, not the full URL — Google's sign-in URL
+    carries classroom.google.com inside its continue= parameter, so a
+    substring match would fire while still on accounts.google.com.
+    """
+    host = urlparse(url).hostname or ""
+    return host == "classroom.google.com" or host.endswith("elearningontario.ca")
+
+# Directory to save debug screenshots, computed once at import
+SCREENSHOT_DIR = Path(__file__).parent / "debug_screenshots"
+
+# Persisted state lives under the user's cache dir — private to the
+# account, unlike the world-readable system temp dir, and surviving
+# reboots, which suits the "skip login on re-runs" intent.
+CACHE_DIR = Path.home() / ".cache" / "classroom-aggregator"
+
+
+def _session_state_path(username: str) -> Path:
+    """Where the persisted session state for this user lives."""
+    safe = re.sub(r"[^A-Za-z0-9@._-]", "_", username)
+    return CACHE_DIR / f"tdsb_session_{safe}.json"
+
+
+# Recycle a pooled browser after this many checkouts to bound memory drift
+BROWSER_POOL_RECYCLE_AFTER = 100
+
+# One playwright driver for the whole process.  Every start()/stop() pair
+# spawns and kills the Node driver (~hundreds of ms), so all TDSBAuth
+# instances and the pool share a single lazily-started instance that
+# simply dies with the interpreter.
+_PLAYWRIGHT = None
+_PLAYWRIGHT_LOCK = asyncio.Lock()
+
+
+async def _get_playwright():
+    """Start (once) and return the process-wide playwright driver."""
+    global _PLAYWRIGHT
+    async with _PLAYWRIGHT_LOCK:
+        if _PLAYWRIGHT is None:
+            _PLAYWRIGHT = await async_playwright().start()
+    return _PLAYWRIGHT
+
+
+class BrowserPool:
+    """Pre-warmed pool of Firefox browsers.
+
+    Launching a browser costs seconds of process startup; contexts on an
+    already-running browser cost tens of milliseconds.  Long-running callers
+    can ``await POOL.warmup(n)`` once at boot so that each ``TDSBAuth``
+    checks out a warm browser instead of launching its own.  Browsers are
+    recycled after ``recycle_after`` checkouts to bound native memory drift.
+
+    The one-shot CLI path is unaffected: if the pool was never warmed,
+    ``TDSBAuth.start_browser`` launches a browser directly as before.
+    """
+
+    def __init__(self, recycle_after: int = BROWSER_POOL_RECYCLE_AFTER):
+        self._queue: asyncio.Queue[Browser] = asyncio.Queue()
+        self._playwright = None
+        self._headless = True
+        self._recycle_after = recycle_after
+        self._checkouts: dict[Browser, int] = {}
+        self.warmed = False
+
+    async def _launch(self) -> Browser:
+        browser = await self._playwright.firefox.launch(headless=self._headless)
+        self._checkouts[browser] = 0
+        return browser
+
+    async def warmup(self, n: int = 4, headless: bool = True):
+        """Launch ``n`` browsers up front; playwright starts once process-wide."""
+        if self._playwright is None:
+            self._playwright = await _get_playwright()
+        self._headless = headless
+        for _ in range(n):
+            await self._queue.put(await self._launch())
+        self.warmed = True
+        logger.info("Browser pool warmed with %d browsers (headless=%s)", n, headless)
+
+    async def acquire(self) -> Browser:
+        browser = await self._queue.get()
+        self._checkouts[browser] += 1
+        return browser
+
+    async def release(self, browser: Browser):
+        """Return a browser to the pool, recycling it if it has aged out."""
+        if self._checkouts.get(browser, 0) >= self._recycle_after:
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug("Closing aged pool browser: %s", e)
+            self._checkouts.pop(browser, None)
+            browser = await self._launch()
+            logger.info("Recycled aged pool browser")
+        await self._queue.put(browser)
+
+    async def shutdown(self):
+        """Close all pooled browsers and stop playwright."""
+        while not self._queue.empty():
+            browser = self._queue.get_nowait()
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug("Closing pool browser: %s", e)
+        self._checkouts.clear()
+        # The shared playwright driver is deliberately left running — other
+        # auth sessions may still be using it, and it dies with the process.
+        self._playwright = None
+        self.warmed = False
+
+
+# Module-level pool; warmed up explicitly by long-running callers
+POOL = BrowserPool()
 
 
 class TDSBAuth:
@@ -33,28 +159,105 @@ class TDSBAuth:
         "&passive=true"
     )
     BRIGHTSPACE_URL = "https://tdsb.elearningontario.ca/d2l/home"
+    # D2L's SSO-initiate endpoint.  Hitting it directly skips the landing
+    # page, the "Staff And Students Login" click and the redirect wait.
+    # target= brings us back to the homepage once Entra finishes.
+    BRIGHTSPACE_SSO_INITIATE_URL = (
+        "https://tdsb.elearningontario.ca/d2l/lp/auth/saml/initiate-login"
+        "?target=%2fd2l%2fhome"
+    )
+
+    # Selector unions used by the sign-in handlers.  These are static, so
+    # keep them as class constants — one place to extend when Google or
+    # Entra renames a field, and no per-call string rebuilding.
+    EMAIL_SEL = 'input[type="email"], input#identifierId, input[name="identifier"]'
+    GOOGLE_NEXT_SEL = (
+        '#identifierNext, button:has-text("Next"), '
+        'input[type="submit"], button[type="submit"]'
+    )
+    ENTRA_USER_SEL = (
+        'input[name="loginfmt"], input[name="UserName"], '
+        'input[name="login"], input[type="email"]'
+    )
+    ENTRA_PW_SEL = (
+        'input[name="passwd"], input[name="Password"], '
+        'input[name="password"], input[type="password"]'
+    )
+    ENTRA_SUBMIT = "#idSIButton9"
+    # What Entra can show after "Next": an inline error, or the account
+    # picker (when the browser already knows one or more accounts).
+    ENTRA_ERROR_SEL = '#usernameError, #passwordError, div[role="alert"]'
+    ENTRA_PICKER_SEL = 'div[data-test-id="account-tile"], #tilesHolder .tile'
+
+    # The login flows never read pixels, so images/fonts/media are dead
+    # weight; the host list is third-party analytics that only slows the
+    # SSO pages down.  Entra/Google first-party JS is NOT blocked — it is
+    # required for the form submits.
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+    BLOCKED_HOSTS = (
+        "doubleclick.net",
+        "googletagmanager.com",
+        "google-analytics.com",
+    )
 
-    def __init__(self, username: str, password: str, debug: bool = False):
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        debug: bool = False,
+        nav_timeout: int = 20000,
+        reuse_session: bool = True,
+    ):
         self.username = username
         self.password = password
         self.debug = debug
-        self._playwright = None
+        # Persist/restore the Entra session across CLI invocations so
+        # re-runs skip the login forms entirely while the cookies last
+        self.reuse_session = reuse_session
+        # Navigation timeout (ms).  Real pages load in well under 5 s; long
+        # waits only delay surfacing genuine failures.  Raise this for
+        # legitimately slow networks.
+        self.nav_timeout = nav_timeout
         self._browser: Browser | None = None
+        self._from_pool = False
         self._gc_context: BrowserContext | None = None
         self._bs_context: BrowserContext | None = None
+        # Cookies/storage captured after the first successful Entra login,
+        # so later contexts can skip the username/password dance entirely.
+        self._entra_state: dict | None = None
+        self._start_lock = asyncio.Lock()
+        # In-flight debug screenshot tasks, awaited in close()
+        self._screenshot_tasks: list[asyncio.Task] = []
+        # Most-recent debug captures, kept in memory and flushed to disk
+        # only when a flow fails — the happy path does zero disk I/O.
+        self._screenshot_ring: deque[tuple[str, bytes]] = deque(maxlen=5)
 
     async def start_browser(self, headless: bool = False):
-        """Launch the Firefox browser via Playwright."""
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.firefox.launch(
-            headless=headless,
-        )
-        logger.info("Launched Firefox (headless=%s)", headless)
-        if self.debug:
-            os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+        """Check out a pooled browser, or launch Firefox directly.
+
+        Idempotent and safe to call from concurrent login tasks — the lock
+        ensures only the first caller launches; the rest reuse the browser.
+        """
+        async with self._start_lock:
+            if self._browser is not None:
+                return
+            if POOL.warmed:
+                self._browser = await POOL.acquire()
+                self._from_pool = True
+                logger.info("Checked out browser from pool")
+            else:
+                playwright = await _get_playwright()
+                self._browser = await playwright.firefox.launch(
+                    headless=headless,
+                )
+                logger.info("Launched Firefox (headless=%s)", headless)
 
     async def close(self):
         """Clean up browser resources — tolerant of already-closed objects."""
+        # Flush any in-flight debug screenshots while pages are still alive
+        if self._screenshot_tasks:
+            await asyncio.gather(*self._screenshot_tasks, return_exceptions=True)
+            self._screenshot_tasks.clear()
         for label, ctx in [("gc", self._gc_context), ("bs", self._bs_context)]:
             if ctx is not None:
                 try:
@@ -62,26 +265,122 @@ class TDSBAuth:
                 except Exception as e:
                     logger.debug("Closing %s context: %s", label, e)
         if self._browser:
+            if self._from_pool:
+                await POOL.release(self._browser)
+                logger.info("Returned browser to pool")
+            else:
+                try:
+                    await self._browser.close()
+                except Exception as e:
+                    logger.debug("Closing browser: %s", e)
+        # The shared playwright driver stays up for the rest of the process.
+        logger.info("Browser closed")
+
+    async def _screenshot(self, page: Page, name: str):
+        """Schedule a debug screenshot if debug mode is on.
+
+        The capture is fire-and-forget and lands in an in-memory ring of
+        the most recent shots; nothing touches disk unless a flow fails
+        and save_debug_ring() flushes the ring post-mortem.
+        """
+        if not self.debug:
+            return
+
+        async def _capture():
             try:
-                await self._browser.close()
+                # Viewport-only JPEG: full_page forces a scroll-stitch and
+                # layout recalc, and the login pages fit in 1280x900 anyway.
+                # These are diagnostic shots — they don't need PNG fidelity.
+                buf = await page.screenshot(type="jpeg", quality=60)
+                self._screenshot_ring.append((name, buf))
             except Exception as e:
-                logger.debug("Closing browser: %s", e)
-        if self._playwright:
+                logger.debug("Screenshot failed (%s): %s", name, e)
+
+        self._screenshot_tasks.append(asyncio.create_task(_capture()))
+
+    async def save_debug_ring(self):
+        """Flush the most recent debug screenshots to disk (post-mortem)."""
+        if not self.debug:
+            return
+        if self._screenshot_tasks:
+            await asyncio.gather(*self._screenshot_tasks, return_exceptions=True)
+            self._screenshot_tasks.clear()
+        if not self._screenshot_ring:
+            return
+        SCREENSHOT_DIR.mkdir(exist_ok=True)
+        while self._screenshot_ring:
+            name, buf = self._screenshot_ring.popleft()
+            path = SCREENSHOT_DIR / f"{name}.jpg"
+            path.write_bytes(buf)
+            logger.debug("Screenshot saved: %s", path)
+
+    def _load_session_state(self) -> dict | None:
+        """Return the Entra session state, loading the persisted copy once."""
+        if self._entra_state is None and self.reuse_session:
+            path = _session_state_path(self.username)
             try:
-                await self._playwright.stop()
+                if path.exists():
+                    self._entra_state = json.loads(path.read_text())
+                    logger.info("Restored session state from %s", path)
             except Exception as e:
-                logger.debug("Stopping playwright: %s", e)
-        logger.info("Browser closed")
+                logger.debug("Could not load session state: %s", e)
+        return self._entra_state
 
-    async def _screenshot(self, page: Page, name: str):
-        """Save a debug screenshot if debug mode is on."""
-        if self.debug:
+    async def _save_session_state(self, context: BrowserContext):
+        """Capture this context's session and persist it for future runs."""
+        try:
+            self._entra_state = await context.storage_state()
+        except Exception as e:
+            logger.debug("Could not capture storage state: %s", e)
+            return
+        if self.reuse_session:
             try:
-                path = os.path.join(SCREENSHOT_DIR, f"{name}.png")
-                await page.screenshot(path=path, full_page=True)
-                logger.debug("Screenshot saved: %s", path)
+                path = _session_state_path(self.username)
+                path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+                # These are live SSO cookies — open with owner-only
+                # permissions even if the file already exists looser
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, "w") as f:
+                    f.write(json.dumps(self._entra_state))
+                logger.debug("Persisted session state to %s", path)
             except Exception as e:
-                logger.debug("Screenshot failed (%s): %s", name, e)
+                logger.debug("Could not persist session state: %s", e)
+
+    @staticmethod
+    async def _race(*coros):
+        """Await several coroutines, returning when the first one finishes.
+
+        The losers are cancelled.  The winner's exception (e.g. a timeout)
+        propagates, so call sites keep their existing try/except handling.
+        """
+        tasks = [asyncio.create_task(c) for c in coros]
+        try:
+            done, pending = await asyncio.wait(
+                tasks, return_when=asyncio.FIRST_COMPLETED
+            )
+            return next(iter(done)).result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _block_heavy_resources(self, context: BrowserContext):
+        """Abort image/font/media and analytics requests on this context.
+
+        Cuts most of the bytes on the Google sign-in and Brightspace
+        landing pages, so domcontentloaded fires measurably sooner.
+        """
+        async def _route(route):
+            request = route.request
+            if (
+                request.resource_type in self.BLOCKED_RESOURCE_TYPES
+                or any(host in request.url for host in self.BLOCKED_HOSTS)
+            ):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", _route)
 
     def _new_context_args(self) -> dict:
         # No custom user_agent — let the real browser send its own current UA
@@ -90,6 +389,23 @@ class TDSBAuth:
             "locale": "en-US",
         }
 
+    async def login_all(self) -> tuple[BrowserContext, BrowserContext]:
+        """
+        Log into Google Classroom and Brightspace concurrently.
+
+        Both flows build their own ``BrowserContext`` on the shared browser
+        (contexts are far cheaper than browser launches), and they are
+        network-bound on SSO redirects, so running them in parallel cuts
+        total login time from the sum of the two flows to the max.  Each
+        context authenticates against Entra independently — the cost is one
+        extra password submit, which is cheaper than serializing the flows.
+        """
+        gc_context, bs_context = await asyncio.gather(
+            self.login_google_classroom(),
+            self.login_brightspace(),
+        )
+        return gc_context, bs_context
+
     # ─── Google Classroom Login ─────────────────────────────────────────
 
     async def login_google_classroom(self) -> BrowserContext:
@@ -103,25 +419,49 @@ class TDSBAuth:
           4. Enter password on Entra           → Entra authenticates
           5. Redirect back through Google      → lands on classroom.google.com
         """
-        self._gc_context = await self._browser.new_context(**self._new_context_args())
+        # Seed the context from a persisted session when one exists — the
+        # passive ServiceLogin URL then redirects straight to Classroom.
+        context_args = self._new_context_args()
+        if self._load_session_state() is not None:
+            context_args["storage_state"] = self._entra_state
+        self._gc_context = await self._browser.new_context(**context_args)
+        await self._block_heavy_resources(self._gc_context)
         page = await self._gc_context.new_page()
 
         # ── Step 1: Navigate to Google sign-in (not classroom.google.com) ──
         logger.info("Navigating to Google sign-in page...")
-        await page.goto(self.GOOGLE_LOGIN_URL, wait_until="domcontentloaded", timeout=60000)
-        await page.wait_for_load_state("load", timeout=30000)
+        # domcontentloaded is enough — waiting for 'load' blocks on Google's
+        # tracker scripts; the email-field wait below is the real gate.
+        await page.goto(
+            self.GOOGLE_LOGIN_URL,
+            wait_until="domcontentloaded", timeout=self.nav_timeout,
+        )
         await self._screenshot(page, "01_google_signin_page")
         logger.info("Google sign-in page loaded: %s", page.url)
 
-        # ── Step 2: Enter email on the Google sign-in form ──
-        await self._handle_google_sign_in(page)
+        # Check the hostname, not the full URL — the sign-in URL carries
+        # classroom.google.com inside its continue= parameter, so a
+        # substring test is true even when we're still on accounts.google.com
+        if urlparse(page.url).hostname == "classroom.google.com":
+            # Restored session was still valid — no forms to fill
+            logger.info("Session restored — skipped Google/Entra login forms")
+        else:
+            # ── Step 2: Enter email on the Google sign-in form ──
+            await self._handle_google_sign_in(page)
 
-        # ── Step 3+4: Handle Entra login (Google needs generous timeouts) ──
-        await self._handle_entra_login_google(page)
+            # ── Step 3+4: Handle Entra login (Google needs generous timeouts) ──
+            await self._handle_entra_login(
+                page, source="google_classroom",
+                form_timeout=30000, kmsi_timeout=8000,
+            )
 
         # ── Step 5: Wait for Google Classroom to fully load ──
         await self._wait_for_google_classroom(page)
 
+        # Capture the Entra session so the Brightspace context (and future
+        # CLI runs, via the persisted copy) can skip the login forms.
+        await self._save_session_state(self._gc_context)
+
         logger.info("Google Classroom login complete — url: %s", page.url)
         return self._gc_context
 
@@ -130,24 +470,17 @@ class TDSBAuth:
         current = page.url
         logger.info("Handling Google sign-in — current URL: %s", current)
 
-        # Google sign-in has several possible selectors for the email field
-        email_selectors = [
-            'input[type="email"]',
-            'input#identifierId',
-            'input[name="identifier"]',
-        ]
-
+        # The comma union races the possible email-field variants in one
+        # DOM scan instead of paying a full timeout per missing selector.
         filled = False
-        for sel in email_selectors:
-            try:
-                locator = page.locator(sel)
-                await locator.first.wait_for(state="visible", timeout=10000)
-                await locator.first.fill(self.username)
-                logger.info("Filled email with selector: %s", sel)
-                filled = True
-                break
-            except Exception:
-                continue
+        try:
+            locator = page.locator(self.EMAIL_SEL)
+            await locator.first.wait_for(state="visible", timeout=10000)
+            await locator.first.fill(self.username)
+            logger.info("Filled email field")
+            filled = True
+        except Exception:
+            pass
 
         if not filled:
             # Maybe we're already past this page or on a different page
@@ -162,19 +495,12 @@ class TDSBAuth:
                     'div:has-text("Sign in"), '
                     'button:has-text("Sign in")'
                 )
-                if await alt.count() > 0:
-                    await alt.first.click()
-                    await page.wait_for_timeout(2000)
-                    # Retry email entry
-                    for sel in email_selectors:
-                        try:
-                            loc = page.locator(sel)
-                            await loc.first.wait_for(state="visible", timeout=5000)
-                            await loc.first.fill(self.username)
-                            filled = True
-                            break
-                        except Exception:
-                            continue
+                await alt.first.click(timeout=3000)
+                # Retry email entry — the wait below gates on the field
+                loc = page.locator(self.EMAIL_SEL)
+                await loc.first.wait_for(state="visible", timeout=5000)
+                await loc.first.fill(self.username)
+                filled = True
             except Exception:
                 pass
 
@@ -185,36 +511,25 @@ class TDSBAuth:
 
         await self._screenshot(page, "02_email_entered")
 
-        # Click "Next" — Google uses either a button#identifierNext or type=submit
-        next_selectors = [
-            '#identifierNext',
-            'button:has-text("Next")',
-            'input[type="submit"]',
-            'button[type="submit"]',
-        ]
-        for sel in next_selectors:
-            try:
-                btn = page.locator(sel)
-                if await btn.count() > 0 and await btn.first.is_visible():
-                    await btn.first.click()
-                    logger.info("Clicked Next with selector: %s", sel)
-                    break
-            except Exception:
-                continue
+        # Click "Next" — Google uses either a button#identifierNext or type=submit.
+        # click() already waits for visibility, so a bounded click replaces
+        # the count()/is_visible() pre-checks (two round-trips each).
+        try:
+            await page.locator(self.GOOGLE_NEXT_SEL).first.click(timeout=5000)
+            logger.info("Clicked Next on Google sign-in")
+        except Exception:
+            pass
 
-        # Wait for navigation — Google will redirect to Entra for @tdsb.ca
+        # Wait for navigation — Google will redirect to Entra for @tdsb.ca.
+        # Race the native URL wait against a password field appearing (for
+        # flows that stay on the same host) instead of polling injected JS.
         logger.info("Waiting for redirect to TDSB Entra SSO...")
         try:
-            # Wait for either Entra page or a password field
-            await page.wait_for_function(
-                """() => {
-                    return window.location.hostname.includes('microsoftonline') ||
-                           window.location.hostname.includes('login.microsoft') ||
-                           window.location.hostname.includes('login.live') ||
-                           window.location.hostname.includes('tdsb') ||
-                           document.querySelector('input[type="password"]') !== null;
-                }""",
-                timeout=20000,
+            await self._race(
+                page.wait_for_url(ENTRA_HOSTS_RE, timeout=20000),
+                page.wait_for_selector(
+                    'input[type="password"]', state="attached", timeout=20000
+                ),
             )
         except Exception as e:
             logger.warning("Redirect wait: %s — current URL: %s", e, page.url)
@@ -224,147 +539,54 @@ class TDSBAuth:
 
     # ─── Google-specific Entra handler (generous timeouts) ───────────
 
-    async def _handle_entra_login_google(self, page: Page):
-        """
-        Handle Entra login after Google redirect.
-
-        The BssoInterrupt page can take several seconds to auto-submit.
-        We use generous timeouts here because Google auth is the first
-        login and there's no existing Entra session to reuse.
-        """
-        source = "google_classroom"
-        logger.info("Handling Entra login (Google) — URL: %s", page.url)
-        await self._screenshot(page, "04_entra_start_google")
-
-        try:
-            # ── 1. Wait for real Entra form (past BssoInterrupt) ──
-            logger.info("Waiting for Entra login form (BssoInterrupt may take a few seconds)…")
-            username_field = None
-            try:
-                loc = page.locator('input[name="loginfmt"]')
-                await loc.wait_for(state="visible", timeout=30000)
-                username_field = loc
-                logger.info("Standard Entra username field found")
-            except Exception:
-                for sel in ['input[name="UserName"]', 'input[name="login"]', 'input[type="email"]']:
-                    try:
-                        loc = page.locator(sel)
-                        await loc.first.wait_for(state="visible", timeout=5000)
-                        username_field = loc.first
-                        logger.info("Found username field with fallback: %s", sel)
-                        break
-                    except Exception:
-                        continue
-
-            if username_field is None:
-                await self._screenshot(page, "04_entra_no_username_google")
-                logger.error("No username field found on Entra (Google) — URL: %s", page.url)
-                return
-
-            await self._screenshot(page, "05_entra_username_visible_google")
-
-            # ── 2. Enter username and click Next ──
-            await username_field.fill(self.username)
-            logger.info("Entered username on Entra")
-            next_btn = page.locator("#idSIButton9")
-            await next_btn.click()
-            logger.info("Clicked Next on Entra username page")
-            await page.wait_for_timeout(2000)
-            await self._screenshot(page, "05_entra_after_next_google")
-
-            # ── 3. Wait for password field ──
-            logger.info("Waiting for password field…")
-            passwd_loc = page.locator('input[name="passwd"]')
-            try:
-                await passwd_loc.first.wait_for(state="visible", timeout=15000)
-            except Exception:
-                for sel in ['input[name="Password"]', 'input[name="password"]', 'input[type="password"]:visible']:
-                    try:
-                        loc = page.locator(sel)
-                        await loc.first.wait_for(state="visible", timeout=5000)
-                        passwd_loc = loc
-                        break
-                    except Exception:
-                        continue
-                else:
-                    await self._screenshot(page, "06_no_password_google")
-                    logger.error("No password field (Google) — URL: %s", page.url)
-                    return
-
-            await passwd_loc.first.fill(self.password)
-            logger.info("Entered password on Entra")
-            await self._screenshot(page, "06_password_entered_google")
-
-            # ── 4. Click Sign In ──
-            signin_btn = page.locator("#idSIButton9")
-            await signin_btn.click()
-            logger.info("Clicked Sign In on Entra")
-            await page.wait_for_timeout(3000)
-            await self._screenshot(page, "07_after_signin_google")
-            logger.info("After sign-in — URL: %s", page.url)
-
-            # ── 5. Handle "Stay signed in?" (generous timeouts for Google) ──
-            await self._handle_stay_signed_in(page, wait_timeout=8000, post_click_wait=3000)
-
-        except Exception as e:
-            await self._screenshot(page, "08_entra_error_google")
-            logger.error("Entra login error (Google): %s — URL: %s", e, page.url)
-
-    # ─── Brightspace Entra handler (fast, with SSO auto-complete) ─────
+    # ─── Entra handler (shared by both flows, with SSO auto-complete) ──
 
-    async def _handle_entra_login(self, page: Page, source: str = ""):
+    async def _handle_entra_login(
+        self,
+        page: Page,
+        source: str = "",
+        *,
+        form_timeout: int = 15000,
+        kmsi_timeout: int = 3000,
+    ):
         """
-        Handle Entra login for Brightspace.
-
-        Since Google Classroom already established an Entra session, SSO may
-        auto-complete and redirect straight to Brightspace with no login form.
-        We race the login form against the destination URL.
+        Handle Entra login for either platform.
+
+        When an Entra session already exists (persisted state, or the other
+        flow got there first), SSO may auto-complete and redirect straight
+        to the destination with no login form, so the form is always raced
+        against the destination URL.  The Google flow passes generous
+        timeouts because the BssoInterrupt page can take several seconds to
+        auto-submit; Brightspace keeps the short defaults.
         """
         logger.info("Handling Entra login (%s) — URL: %s", source, page.url)
         await self._screenshot(page, f"04_entra_start_{source}")
 
         try:
             # ── 1. Race: login form vs SSO auto-complete ──
+            # ENTRA_USER_SEL unions every form variant in one comma-union
+            # wait, and the native URL wait needs no JS bridge.
             logger.info("Waiting for Entra form or SSO auto-complete…")
             username_field = None
             try:
-                await page.wait_for_function(
-                    """() => {
-                        const el = document.querySelector('input[name="loginfmt"]');
-                        if (el && el.offsetParent !== null) return true;
-                        const h = window.location.hostname;
-                        if (h.includes('elearningontario') || h.includes('classroom.google'))
-                            return true;
-                        return false;
-                    }""",
-                    timeout=15000,
+                await self._race(
+                    page.wait_for_url(_sso_done, timeout=form_timeout),
+                    page.locator(self.ENTRA_USER_SEL).first.wait_for(
+                        state="visible", timeout=form_timeout
+                    ),
                 )
-                if "elearningontario" in page.url or "classroom.google" in page.url:
+                if _sso_done(page.url):
                     logger.info("SSO auto-completed — already on destination: %s", page.url)
                     return
-                loc = page.locator('input[name="loginfmt"]')
-                username_field = loc
-                logger.info("Standard Entra username field found")
+                username_field = page.locator(self.ENTRA_USER_SEL).first
+                logger.info("Entra username field found")
             except Exception:
                 # Check if we redirected during the wait
-                if "elearningontario" in page.url:
+                if _sso_done(page.url):
                     logger.info("SSO auto-completed during fallback — URL: %s", page.url)
                     return
-                for sel in ['input[name="UserName"]', 'input[name="login"]', 'input[type="email"]']:
-                    try:
-                        loc = page.locator(sel)
-                        await loc.first.wait_for(state="visible", timeout=3000)
-                        username_field = loc.first
-                        logger.info("Found username field with fallback: %s", sel)
-                        break
-                    except Exception:
-                        continue
 
             if username_field is None:
-                # Final check — maybe we landed on Brightspace while in fallback
-                if "elearningontario" in page.url:
-                    logger.info("SSO auto-completed — URL: %s", page.url)
-                    return
                 await self._screenshot(page, f"04_entra_no_username_{source}")
                 logger.error("No username field found on Entra (%s) — URL: %s", source, page.url)
                 return
@@ -374,54 +596,85 @@ class TDSBAuth:
             # ── 2. Enter username and click Next ──
             await username_field.fill(self.username)
             logger.info("Entered username on Entra")
-            next_btn = page.locator("#idSIButton9")
+            next_btn = page.locator(self.ENTRA_SUBMIT)
             await next_btn.click()
             logger.info("Clicked Next on Entra username page")
-            await page.wait_for_timeout(1000)
             await self._screenshot(page, f"05_entra_after_next_{source}")
 
-            # ── 3. Wait for password field ──
-            logger.info("Waiting for password field…")
-            passwd_loc = page.locator('input[name="passwd"]')
-            try:
-                await passwd_loc.first.wait_for(state="visible", timeout=15000)
-            except Exception:
-                for sel in ['input[name="Password"]', 'input[name="password"]', 'input[type="password"]:visible']:
-                    try:
-                        loc = page.locator(sel)
-                        await loc.first.wait_for(state="visible", timeout=5000)
-                        passwd_loc = loc
-                        break
-                    except Exception:
-                        continue
-                else:
-                    await self._screenshot(page, f"06_no_password_field_{source}")
-                    logger.error("No password field (%s) — URL: %s", source, page.url)
-                    return
+            # ── 3. Wait for whatever Entra shows next and branch on it ──
+            passwd_loc = await self._await_entra_password(page, source)
+            if passwd_loc is None:
+                await self._screenshot(page, f"06_no_password_field_{source}")
+                logger.error("No password field (%s) — URL: %s", source, page.url)
+                return
 
             await passwd_loc.first.fill(self.password)
             logger.info("Entered password on Entra")
             await self._screenshot(page, f"06_password_entered_{source}")
 
             # ── 4. Click Sign In ──
-            signin_btn = page.locator("#idSIButton9")
+            signin_btn = page.locator(self.ENTRA_SUBMIT)
             await signin_btn.click()
             logger.info("Clicked Sign In on Entra")
-            await page.wait_for_timeout(1000)
             await self._screenshot(page, f"07_after_signin_{source}")
             logger.info("After sign-in — URL: %s", page.url)
 
             # ── 5. Handle "Stay signed in?" ──
-            await self._handle_stay_signed_in(page)
+            # The prompt wait inside doubles as the post-sign-in wait.
+            await self._handle_stay_signed_in(page, wait_timeout=kmsi_timeout)
 
         except Exception as e:
             await self._screenshot(page, f"08_entra_error_{source}")
             logger.error("Entra login error (%s): %s — URL: %s", source, e, page.url)
+            await self.save_debug_ring()
 
-    async def _handle_stay_signed_in(
-        self, page: Page, wait_timeout: int = 3000, post_click_wait: int = 1000
+    async def _await_entra_password(
+        self, page: Page, source: str, timeout: int = 15000
     ):
-        """Handle the 'Stay signed in?' / 'Don't show this again' prompt."""
+        """Wait once for Entra's post-Next state and branch on it.
+
+        After "Next" Entra either shows the password field directly, an
+        inline error (bad/unknown username), or the account picker (when a
+        login hint pre-filled the username).  One compound wait covers all
+        three, so no variant costs a separate full timeout.
+
+        Returns the password locator, or None when login cannot proceed.
+        """
+        logger.info("Waiting for Entra password/error/picker (%s)…", source)
+        compound = page.locator(
+            f"{self.ENTRA_PW_SEL}, {self.ENTRA_ERROR_SEL}, {self.ENTRA_PICKER_SEL}"
+        )
+        try:
+            await compound.first.wait_for(state="visible", timeout=timeout)
+        except Exception:
+            return None
+
+        passwd_loc = page.locator(self.ENTRA_PW_SEL)
+        try:
+            if await passwd_loc.first.is_visible():
+                return passwd_loc
+            err = page.locator(self.ENTRA_ERROR_SEL)
+            if await err.count() > 0 and await err.first.is_visible():
+                text = (await err.first.inner_text()).strip()
+                logger.error("Entra error after username (%s): %s", source, text)
+                return None
+            # Account picker — choose the first tile, then wait for password
+            picker = page.locator(self.ENTRA_PICKER_SEL)
+            if await picker.count() > 0:
+                await picker.first.click()
+                logger.info("Picked account tile on Entra (%s)", source)
+                await passwd_loc.first.wait_for(state="visible", timeout=timeout)
+                return passwd_loc
+        except Exception as e:
+            logger.debug("Entra post-Next branch (%s): %s", source, e)
+        return None
+
+    async def _handle_stay_signed_in(self, page: Page, wait_timeout: int = 3000):
+        """Handle the 'Stay signed in?' / 'Don't show this again' prompt.
+
+        No post-click wait — the caller's next step (waiting for the
+        destination URL) is the real gate after 'Yes'.
+        """
         try:
             # Entra "Stay signed in?" has id=idSIButton9 for "Yes"
             stay_yes = page.locator(
@@ -432,7 +685,6 @@ class TDSBAuth:
             await stay_yes.first.wait_for(state="visible", timeout=wait_timeout)
             await stay_yes.first.click()
             logger.info("Clicked 'Yes' on Stay signed in prompt")
-            await page.wait_for_timeout(post_click_wait)
             await self._screenshot(page, "09_after_stay_signed_in")
         except Exception:
             # Prompt didn't appear — that's fine
@@ -444,10 +696,16 @@ class TDSBAuth:
         try:
             # Wait for the URL to contain classroom.google.com
             await page.wait_for_url(
-                "**/classroom.google.com/**", timeout=45000
+                "**/classroom.google.com/**", timeout=self.nav_timeout
             )
-            await page.wait_for_load_state("load", timeout=30000)
-            await page.wait_for_timeout(3000)
+            # Gate on the class-card links actually rendering, rather than
+            # waiting for 'load' (blocked by non-critical subresources).
+            try:
+                await page.wait_for_selector(
+                    'a[href*="/c/"]', state="visible", timeout=10000
+                )
+            except Exception:
+                logger.debug("No class links visible yet — continuing")
             await self._screenshot(page, "10_google_classroom_loaded")
             logger.info("Google Classroom loaded: %s", page.url)
         except Exception as e:
@@ -455,6 +713,7 @@ class TDSBAuth:
             logger.warning(
                 "Google Classroom wait issue: %s — final URL: %s", e, page.url
             )
+            await self.save_debug_ring()
 
     # ─── Brightspace Login ──────────────────────────────────────────────
 
@@ -464,26 +723,76 @@ class TDSBAuth:
         Flow: Brightspace landing → click "Staff And Students Login"
               → TDSB SSO (Entra) → login → redirect back to Brightspace.
         """
-        self._bs_context = await self._browser.new_context(**self._new_context_args())
+        # Seed the context with the Entra session from the Google login when
+        # one exists — SSO then auto-completes with no login form, which
+        # _handle_entra_login already detects via the destination URL.
+        context_args = self._new_context_args()
+        if self._load_session_state() is not None:
+            context_args["storage_state"] = self._entra_state
+            logger.info("Reusing Entra session from Google Classroom login")
+        self._bs_context = await self._browser.new_context(**context_args)
+        await self._block_heavy_resources(self._bs_context)
         page = await self._bs_context.new_page()
 
-        logger.info("Navigating to Brightspace...")
-        await page.goto(
-            self.BRIGHTSPACE_URL, wait_until="domcontentloaded", timeout=60000
-        )
-        await page.wait_for_load_state("load", timeout=30000)
-        await self._screenshot(page, "20_brightspace_start")
-        logger.info("Brightspace start page: %s", page.url)
+        # Try the direct SSO-initiate URL first — lands on Entra (or straight
+        # back on Brightspace if the session is hot) without the landing
+        # page round-trip.  Fall back to the landing-page click if D2L ever
+        # changes or breaks the endpoint.
+        sso_initiated = False
+        logger.info("Navigating to Brightspace SSO initiate URL...")
+        try:
+            await page.goto(
+                self.BRIGHTSPACE_SSO_INITIATE_URL,
+                wait_until="domcontentloaded", timeout=self.nav_timeout,
+            )
+            await self._race(
+                page.wait_for_url(MS_LOGIN_RE, timeout=10000),
+                page.wait_for_url("**/d2l/home**", timeout=10000),
+                page.wait_for_selector(
+                    'input[name="loginfmt"], input[type="password"]',
+                    state="attached", timeout=10000,
+                ),
+            )
+            sso_initiated = True
+            await self._screenshot(page, "20_brightspace_sso_initiate")
+            logger.info("SSO initiate succeeded — URL: %s", page.url)
+        except Exception as e:
+            logger.warning(
+                "Direct SSO initiate failed (%s) — falling back to landing page", e
+            )
 
-        # The landing page has a "Staff And Students Login" button that must
-        # be clicked before we get redirected to Entra SSO.
-        await self._handle_brightspace_landing(page)
+        if not sso_initiated:
+            # domcontentloaded is enough — the login-button lookup below is
+            # the real gate, and 'load' hangs on Brightspace's asset loading.
+            await page.goto(
+                self.BRIGHTSPACE_URL,
+                wait_until="domcontentloaded", timeout=self.nav_timeout,
+            )
+            await self._screenshot(page, "20_brightspace_start")
+            logger.info("Brightspace start page: %s", page.url)
+
+            # The landing page has a "Staff And Students Login" button that
+            # must be clicked before we get redirected to Entra SSO.
+            await self._handle_brightspace_landing(page)
 
         # Handle Entra login — but if we already have an Entra session from
         # Google Classroom, SSO may auto-complete and skip the login form.
-        # Check whether we've already landed on Brightspace first.
-        already_on_bs = "elearningontario.ca" in page.url and "/d2l/" in page.url
-        if already_on_bs:
+        # A one-shot URL check races the redirect: it can miss an SSO hop
+        # that finishes milliseconds later.  Instead, explicitly race the
+        # Brightspace destination against the Entra form and branch on
+        # whichever state the page actually reached.
+        if not ("elearningontario.ca" in page.url and "/d2l/" in page.url):
+            try:
+                await self._race(
+                    page.wait_for_url("**/d2l/home**", timeout=20000),
+                    page.locator('input[name="loginfmt"]').first.wait_for(
+                        state="visible", timeout=20000
+                    ),
+                )
+            except Exception as e:
+                logger.debug("SSO-vs-form race: %s — URL: %s", e, page.url)
+
+        if "elearningontario.ca" in page.url and "/d2l/" in page.url:
             logger.info("Already on Brightspace (SSO auto-completed) — skipping Entra login")
         else:
             await self._handle_entra_login(page, source="brightspace")
@@ -497,24 +806,21 @@ class TDSBAuth:
     async def _handle_brightspace_landing(self, page: Page):
         """Click 'Staff And Students Login' on the Brightspace landing page."""
         try:
-            # Look for the green "Staff And Students Login" button
-            btn_selectors = [
-                'a:has-text("Staff And Students Login")',
-                'button:has-text("Staff And Students Login")',
-                'a:has-text("Staff and Students")',
-                'a:has-text("Staff")',
-            ]
+            # Look for the green "Staff And Students Login" button.  One
+            # comma union and a bounded click: click() waits for visibility
+            # itself, so no count()/is_visible() pre-checks are needed.
             clicked = False
-            for sel in btn_selectors:
-                try:
-                    loc = page.locator(sel)
-                    if await loc.count() > 0 and await loc.first.is_visible():
-                        await loc.first.click()
-                        logger.info("Clicked Brightspace login button: %s", sel)
-                        clicked = True
-                        break
-                except Exception:
-                    continue
+            try:
+                await page.locator(
+                    'a:has-text("Staff And Students Login"), '
+                    'button:has-text("Staff And Students Login"), '
+                    'a:has-text("Staff and Students"), '
+                    'a:has-text("Staff")'
+                ).first.click(timeout=5000)
+                logger.info("Clicked Brightspace login button")
+                clicked = True
+            except Exception:
+                pass
 
             if not clicked:
                 await self._screenshot(page, "20_no_staff_button")
@@ -523,23 +829,23 @@ class TDSBAuth:
                 )
                 return
 
-            # Wait for the redirect to Entra SSO
+            # Wait for the redirect to Entra SSO — native URL wait raced
+            # against the login form appearing, instead of injected-JS polling
             logger.info("Waiting for Entra SSO redirect after clicking login...")
             try:
-                await page.wait_for_function(
-                    """() => {
-                        return window.location.hostname.includes('microsoftonline') ||
-                               window.location.hostname.includes('login.microsoft') ||
-                               window.location.hostname.includes('login.live') ||
-                               document.querySelector('input[type="password"]') !== null ||
-                               document.querySelector('input[name="loginfmt"]') !== null;
-                    }""",
-                    timeout=20000,
+                # MS_LOGIN_RE, not ENTRA_HOSTS_RE — the latter's 'tdsb'
+                # term matches the tdsb.elearningontario.ca URL we are
+                # still sitting on, resolving the wait instantly
+                await self._race(
+                    page.wait_for_url(MS_LOGIN_RE, timeout=20000),
+                    page.wait_for_selector(
+                        'input[name="loginfmt"], input[type="password"]',
+                        state="attached", timeout=20000,
+                    ),
                 )
             except Exception as e:
                 logger.warning("Entra redirect wait: %s — URL: %s", e, page.url)
 
-            await page.wait_for_timeout(2000)
             await self._screenshot(page, "20_after_staff_login_click")
             logger.info("After staff login click — URL: %s", page.url)
 
@@ -553,7 +859,7 @@ class TDSBAuth:
             # If not already on Brightspace, wait for the redirect
             if "elearningontario.ca" not in page.url:
                 await page.wait_for_url(
-                    "**/elearningontario.ca/**", timeout=30000
+                    "**/elearningontario.ca/**", timeout=self.nav_timeout
                 )
             # domcontentloaded is enough — 'load' hangs on Brightspace's
             # heavy async resource loading.
@@ -570,6 +876,7 @@ class TDSBAuth:
             logger.warning(
                 "Brightspace wait issue: %s — final URL: %s", e, page.url
             )
+            await self.save_debug_ring()
 
     async def _dismiss_brightspace_browser_warning(self, page: Page):
         """Dismiss the 'Your browser is looking a little retro' dialog if present."""
@@ -580,10 +887,10 @@ class TDSBAuth:
                 'a:has-text("Got It"), '
                 'a:has-text("Got it")'
             )
-            if await got_it.count() > 0 and await got_it.first.is_visible():
-                await got_it.first.click()
-                logger.info("Dismissed 'browser retro' warning dialog")
-                await page.wait_for_timeout(1000)
+            await got_it.first.click(timeout=1000)
+            logger.info("Dismissed 'browser retro' warning dialog")
+            # Wait for the dialog to actually go away, not a fixed delay
+            await got_it.first.wait_for(state="hidden", timeout=5000)
         except Exception:
             pass  # No dialog — that's fine
 
@@ -6,10 +6,13 @@ Brightspace / elearningontario.ca using Playwright browser automation.
 """
 
 import asyncio
+import functools
 import json
 import logging
 import re
+import time
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 from dateutil import parser as dateparser
 from playwright.async_api import BrowserContext, Page
@@ -18,28 +21,116 @@ from models import (
     ClassInfo, Assignment, Platform, AssignmentStatus, ItemType
 )
 
+# orjson decodes D2L API responses several times faster than stdlib json;
+# fall back silently when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
-# Default semester classes (overridden by .env / constructor arg)
-DEFAULT_SEMESTER_CLASSES = ["ENG", "GLE", "PPL", "History"]
 
+def _loads(raw: bytes):
+    """Decode an API response body with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_line(line: str) -> Optional[datetime]:
+    """Parse a date from a row line, trying the known D2L formats first.
+
+    Cached — the same date string repeats across many rows, and dateutil's
+    fuzzy fallback is expensive enough to be worth a dict lookup.
+    """
+    m = _DATE_RE.search(line)
+    if m:
+        for fmt in _DATE_FORMATS:
+            try:
+                return datetime.strptime(m.group(), fmt)
+            except ValueError:
+                continue
+    try:
+        return dateparser.parse(line, fuzzy=True)
+    except Exception:
+        return None
+
+
+def _api_cache_path(username: str) -> Path:
+    """Where the cached API responses for this user live."""
+    safe = re.sub(r"[^A-Za-z0-9@._-]", "_", username)
+    return _CACHE_DIR / f"brightspace_api_cache_{safe}.json"
+
+
+@functools.lru_cache(maxsize=256)
+def _course_id_from_url(url: str) -> str:
+    """Extract the course/org unit ID from a Brightspace URL.
+
+    Cached — each class URL is probed by the assignment, announcement,
+    and class-list paths, so the regex cascade runs once per URL.
+    """
+    # URLs are like /d2l/home/12345 or ?ou=12345
+    match = _COURSE_ID_HOME_RE.search(url)
+    if match:
+        return match.group(1)
+    match = _COURSE_ID_OU_RE.search(url)
+    if match:
+        return match.group(1)
+    # Try just the last numeric segment
+    match = _COURSE_ID_TAIL_RE.search(url)
+    if match:
+        return match.group(1)
+    return ""
+
+
+def _split_lines(text: str) -> list[str]:
+    """Split row text into stripped, non-empty lines.
+
+    ``splitlines`` is a touch faster than ``split("\\n")`` in CPython, and
+    centralizing the idiom keeps the per-row loops allocation-light.
+    """
+    return [s for s in (l.strip() for l in text.splitlines()) if s]
 
-def _matches_semester_class(class_name: str, semester_classes: list[str] | None = None) -> bool:
-    classes = semester_classes or DEFAULT_SEMESTER_CLASSES
-    name_upper = class_name.upper()
-    for code in classes:
-        if code.upper() in name_upper:
-            return True
-    return False
 
+# Default semester classes (overridden by .env / constructor arg)
+DEFAULT_SEMESTER_CLASSES = ["ENG", "GLE", "PPL", "History"]
 
-def _get_short_code(class_name: str, semester_classes: list[str] | None = None) -> str:
-    classes = semester_classes or DEFAULT_SEMESTER_CLASSES
-    name_upper = class_name.upper()
-    for code in classes:
-        if code.upper() in name_upper:
-            return code.upper()
-    return class_name[:10]
+# Compiled once at import — these run inside per-row loops
+_MONTH_RE = re.compile(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b', re.I)
+# Status keywords, scanned in one pass over the casefolded row text
+_STATUS_RE = re.compile(r'submitted|completed|overdue|past due')
+# D2L renders dates in a handful of fixed formats ("Oct 15, 2024 11:59 PM");
+# strptime against these is far cheaper than dateutil's fuzzy parse, which
+# stays as the fallback for anything unusual.
+_DATE_RE = re.compile(
+    r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{1,2},?\s+\d{4}'
+    r'(?:\s+\d{1,2}:\d{2}\s*(?:am|pm))?',
+    re.I,
+)
+_DATE_FORMATS = (
+    "%b %d, %Y %I:%M %p",
+    "%b %d, %Y",
+    "%B %d, %Y %I:%M %p",
+    "%B %d, %Y",
+)
+# Course IDs appear as /d2l/home/12345, ?ou=12345, or a trailing segment
+_COURSE_ID_HOME_RE = re.compile(r'/d2l/home/(\d+)')
+_COURSE_ID_OU_RE = re.compile(r'ou=(\d+)')
+_COURSE_ID_TAIL_RE = re.compile(r'/(\d+)/?$')
+
+# Disk-backed cache for D2L API responses.  Enrollment and assignment
+# lists change slowly, so re-runs within the TTL skip the network.  The
+# file is keyed per user (like the auth session state) so accounts on
+# the same machine never serve each other's data, and lives in the
+# user's cache dir rather than the world-shared temp dir.
+_CACHE_DIR = Path.home() / ".cache" / "classroom-aggregator"
+ENROLLMENTS_TTL = 3600
+COURSE_DATA_TTL = 300
+# Discovered class lists are stable for a semester; a day-long TTL lets
+# warm starts skip homepage discovery entirely
+CLASSES_TTL = 86400
 
 
 class BrightspaceScraper:
@@ -47,177 +138,459 @@ class BrightspaceScraper:
 
     BASE_URL = "https://tdsb.elearningontario.ca"
 
-    def __init__(self, context: BrowserContext, semester_classes: list[str] | None = None):
+    # Pages used for concurrent per-class scraping.  Each class is dominated
+    # by navigation latency, so a few pages give a near-linear speedup
+    # without hammering D2L.
+    CLASS_PAGE_POOL_SIZE = 4
+
+    # Cap on how long one class may hold a pool page — navigation timeouts
+    # alone would let a stuck course occupy a page for close to a minute
+    CLASS_SCRAPE_TIMEOUT = 20
+
+    # Scraping never reads pixels, so images/fonts/media are dead weight —
+    # D2L pages are heavy with course-tile images.  Stylesheets stay
+    # enabled since innerText respects CSS visibility.
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+    def __init__(
+        self, context: BrowserContext, semester_classes: list[str] | None = None,
+        username: str = "",
+        use_cache: bool = True,
+        include_work_to_do: bool = True,
+        include_upcoming: bool = True,
+        include_quizzes: bool = True,
+    ):
         self.semester_classes = semester_classes or DEFAULT_SEMESTER_CLASSES
+        self.use_cache = use_cache
+        # The disk cache is keyed per user; without a username to scope it
+        # the cache stays in-memory for this run only
+        self._cache_path = _api_cache_path(username) if username else None
+        # The global widgets each cost a navigation; callers that only care
+        # about per-class items can opt out and skip those pages entirely
+        self.include_work_to_do = include_work_to_do
+        self.include_upcoming = include_upcoming
+        self.include_quizzes = include_quizzes
+        self._api_cache: dict | None = None
+        # Upper-cased codes computed once; per-name lookups are memoized
+        # since the same class name is probed for every scraped row
+        self._codes_upper = [c.upper() for c in self.semester_classes]
+        self._match_cache: dict[str, str | None] = {}
         self.context = context
         self.classes: list[ClassInfo] = []
         self.assignments: list[Assignment] = []
+        # Keys of items already collected, so overlapping sources (dropbox
+        # vs news vs Work To Do) don't produce duplicate Assignment objects
+        self._seen: set[tuple[str, str, ItemType]] = set()
+        self._seen_titles: set[str] = set()
 
-    async def _dismiss_browser_warning(self, page):
-        """Dismiss the 'Your browser is looking a little retro' dialog if present."""
+    async def _install_warning_dismisser(self):
+        """Auto-dismiss the 'browser is looking a little retro' dialog.
+
+        The dialog appears at most once per session, so instead of polling
+        for it from Python a MutationObserver injected into every page
+        clicks "Got It" the moment it renders.
+        """
         try:
-            got_it = page.locator(
-                'button:has-text("Got It"), '
-                'button:has-text("Got it"), '
-                'a:has-text("Got It"), '
-                'a:has-text("Got it")'
+            await self.context.add_init_script(
+                """new MutationObserver(() => {
+                    const b = [...document.querySelectorAll('button, a')]
+                        .find(e => /^got it$/i.test((e.textContent || '').trim()));
+                    if (b) b.click();
+                }).observe(document.documentElement, {childList: true, subtree: true});"""
             )
-            if await got_it.count() > 0 and await got_it.first.is_visible():
-                await got_it.first.click()
-                logger.info("Dismissed 'browser retro' warning dialog")
-                await page.wait_for_timeout(1000)
+        except Exception as e:
+            logger.debug("Could not install warning dismisser: %s", e)
+
+    async def _block_heavy_resources(self):
+        """Abort heavy resource types for every page on this context.
+
+        The auth flow installs the same routes on contexts it creates; doing
+        it here too keeps the scraper fast when handed a context from
+        elsewhere.
+        """
+        async def _route(route):
+            if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+                await route.abort()
+            else:
+                # Playwright only invokes the most recently registered
+                # handler; fall back so the auth layer's analytics-host
+                # blocking still sees everything we don't abort
+                await route.fallback()
+
+        try:
+            await self.context.route("**/*", _route)
+        except Exception as e:
+            logger.debug("Could not install resource blocking: %s", e)
+
+    async def _maybe_goto(self, page: Page, url: str, timeout: int = 20000) -> bool:
+        """Navigate unless the page is already on the target URL.
+
+        Returns True when a navigation actually happened, so callers can
+        skip their settle wait on pages that are already rendered.  An
+        exact compare (not substring) keeps a course homepage like
+        /d2l/home/12345 from passing for /d2l/home.
+        """
+        if page.url.rstrip("/") == url.rstrip("/"):
+            return False
+        await page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+        return True
+
+    async def _settle(self, page: Page, selector: str | None = None, timeout: int = 5000):
+        """Wait for the page to quiet down instead of sleeping a fixed pad.
+
+        Network-idle first, then (optionally) the first element the caller
+        actually wants to parse.  Both waits are tolerant — a chatty page or
+        an empty list just falls through at the timeout.
+        """
+        try:
+            await page.wait_for_load_state("networkidle", timeout=timeout)
         except Exception:
             pass
+        if selector:
+            try:
+                await page.locator(selector).first.wait_for(timeout=3000)
+            except Exception:
+                pass
 
     async def _scroll_to_load_all(self, page: Page, max_scrolls: int = 10):
-        """Scroll the page to the bottom to trigger lazy-loaded content."""
-        for _ in range(max_scrolls):
-            previous_height = await page.evaluate("document.body.scrollHeight")
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await page.wait_for_timeout(1500)
-            new_height = await page.evaluate("document.body.scrollHeight")
-            if new_height == previous_height:
-                break
-        # Scroll back to top
-        await page.evaluate("window.scrollTo(0, 0)")
-        await page.wait_for_timeout(500)
+        """Scroll the page to the bottom to trigger lazy-loaded content.
 
-    async def scrape_all(self) -> tuple[list[ClassInfo], list[Assignment]]:
-        """Main entry: scrape classes then assignments for each."""
-        page = self.context.pages[0] if self.context.pages else await self.context.new_page()
+        The whole loop runs inside the browser — one evaluate call instead
+        of three round-trips plus a fixed sleep per iteration — and stops
+        as soon as the scroll height stabilizes.
+        """
+        try:
+            await page.evaluate(
+                """async (maxScrolls) => {
+                    let last = -1;
+                    for (let i = 0; i < maxScrolls; i++) {
+                        window.scrollTo(0, document.body.scrollHeight);
+                        await new Promise(r => setTimeout(r, 800));
+                        if (document.body.scrollHeight === last) break;
+                        last = document.body.scrollHeight;
+                    }
+                    window.scrollTo(0, 0);
+                }""",
+                max_scrolls,
+            )
+        except Exception as e:
+            logger.debug("Scroll-to-load: %s", e)
+
+    def _cache_get(self, key: str, ttl: int):
+        """Return a cached API response younger than ``ttl`` seconds."""
+        if not self.use_cache:
+            return None
+        if self._api_cache is None:
+            self._api_cache = {}
+            try:
+                if self._cache_path is not None and self._cache_path.exists():
+                    self._api_cache = json.loads(self._cache_path.read_text())
+            except Exception as e:
+                logger.debug("Could not load API cache: %s", e)
+        entry = self._api_cache.get(key)
+        if entry and time.time() - entry.get("t", 0) < ttl:
+            return entry.get("v")
+        return None
+
+    def _cache_put(self, key: str, value):
+        """Store a raw API response in the disk cache."""
+        if not self.use_cache or value is None:
+            return
+        if self._api_cache is None:
+            self._api_cache = {}
+        self._api_cache[key] = {"t": time.time(), "v": value}
+        if self._cache_path is None:
+            return
+        try:
+            self._cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            self._cache_path.write_text(json.dumps(self._api_cache))
+        except Exception as e:
+            logger.debug("Could not persist API cache: %s", e)
+
+    def _add(self, a: Assignment) -> bool:
+        """Append an item unless an equivalent one was already collected.
+
+        Items are keyed by (course, normalized title, item type) — O(1)
+        set probes instead of rebuilding a title set per dedup pass.  The
+        type is part of the key so a quiz and an assignment sharing a
+        title within one course are both kept.
+        """
+        norm = a.title.lower().strip()
+        key = (a.course_name, norm, a.item_type)
+        if key in self._seen:
+            return False
+        # Course-less items (Work To Do / calendar lines) dedupe against
+        # every course, matching the old global-title check
+        if not a.course_name and norm in self._seen_titles:
+            return False
+        self._seen.add(key)
+        self._seen_titles.add(norm)
+        self.assignments.append(a)
+        return True
+
+    def _semester_code(self, class_name: str) -> str | None:
+        """Return the semester code matching a class name, or None (cached)."""
+        if class_name not in self._match_cache:
+            name_upper = class_name.upper()
+            self._match_cache[class_name] = next(
+                (c for c in self._codes_upper if c in name_upper), None
+            )
+        return self._match_cache[class_name]
 
-        # Navigate to Brightspace home
-        await page.goto(f"{self.BASE_URL}/d2l/home", wait_until="load", timeout=30000)
-        await page.wait_for_timeout(2000)
+    async def _extract_links(self, page: Page, selector: str) -> list[dict]:
+        """Pull ``{href, text}`` for every match in one evaluate call.
 
-        # Dismiss "Your browser is looking a little retro" dialog if present
-        await self._dismiss_browser_warning(page)
+        A locator loop costs two round-trips per element (get_attribute +
+        inner_text); batching the whole list into a single evaluate keeps
+        the per-row work in plain Python.
+        """
+        try:
+            return await page.evaluate(
+                """(sel) => Array.from(document.querySelectorAll(sel)).map(a => ({
+                    href: a.getAttribute('href') || '',
+                    text: (a.innerText || '').trim(),
+                }))""",
+                selector,
+            )
+        except Exception as e:
+            logger.debug("Batch link extract: %s", e)
+            return []
+
+    async def _extract_texts(self, page: Page, selector: str) -> list[str]:
+        """Pull innerText for every match in one evaluate call."""
+        try:
+            return await page.evaluate(
+                """(sel) => Array.from(document.querySelectorAll(sel)).map(
+                    el => (el.innerText || '').trim())""",
+                selector,
+            )
+        except Exception as e:
+            logger.debug("Batch text extract: %s", e)
+            return []
 
-        # Scroll down to load any lazy-loaded course tiles
-        await self._scroll_to_load_all(page)
+    async def scrape_all(self) -> tuple[list[ClassInfo], list[Assignment]]:
+        """Main entry: scrape classes then assignments for each."""
+        page = self.context.pages[0] if self.context.pages else await self.context.new_page()
 
-        # Get classes
-        all_classes = await self._scrape_class_list(page)
+        await self._block_heavy_resources()
+        await self._install_warning_dismisser()
+
+        # A fresh-enough cached class list skips homepage navigation,
+        # lazy-load scrolling, and all three discovery methods
+        cached_classes = self._cache_get("classes", CLASSES_TTL)
+        if cached_classes:
+            all_classes = [
+                ClassInfo(
+                    name=c["name"],
+                    platform=Platform.BRIGHTSPACE,
+                    url=c["url"],
+                    short_code=c.get("short_code", ""),
+                )
+                for c in cached_classes
+            ]
+        else:
+            # Fire the enrollment-API fetch now so it runs while the
+            # homepage loads and the card scan walks the DOM
+            api_task = asyncio.create_task(self._scrape_classes_via_api())
+
+            # Navigate to Brightspace home — domcontentloaded, since "load"
+            # hangs on Brightspace's heavy async resource loading and the
+            # timeout pads below cover widget hydration anyway
+            await page.goto(f"{self.BASE_URL}/d2l/home", wait_until="domcontentloaded", timeout=30000)
+            await self._settle(page)
+
+            # Scroll down to load any lazy-loaded course tiles
+            await self._scroll_to_load_all(page)
+
+            all_classes = await self._scrape_class_list(page, api_task)
+            if all_classes:
+                self._cache_put("classes", [
+                    {"name": c.name, "url": c.url, "short_code": c.short_code}
+                    for c in all_classes
+                ])
         logger.info("Found %d total classes on Brightspace", len(all_classes))
 
         # Filter to semester classes
-        self.classes = [c for c in all_classes if _matches_semester_class(c.name, self.semester_classes)]
+        self.classes = [c for c in all_classes if self._semester_code(c.name) is not None]
         logger.info("Matched %d semester classes on Brightspace", len(self.classes))
 
         if not self.classes:
             logger.warning("No semester class matches found on Brightspace, using all classes")
             self.classes = all_classes
 
-        # Scrape data for each class
-        for cls in self.classes:
-            try:
-                # Assignments
-                cls_assignments = await self._scrape_class_assignments(page, cls)
-                self.assignments.extend(cls_assignments)
-
-                # Announcements
-                announcements = await self._scrape_class_announcements(page, cls)
-                self.assignments.extend(announcements)
+        # Scrape classes concurrently on a small pool of pages.  Each task
+        # checks a page out of the queue and returns it when done, so at
+        # most CLASS_PAGE_POOL_SIZE navigations are in flight at once.
+        # Results are collected per class and merged once at the end to
+        # avoid interleaved mutation of self.assignments.
+        page_pool: asyncio.Queue[Page] = asyncio.Queue()
+        await page_pool.put(page)
+        for _ in range(min(self.CLASS_PAGE_POOL_SIZE, max(len(self.classes), 1)) - 1):
+            await page_pool.put(await self.context.new_page())
+
+        async def _scrape_one(cls: ClassInfo) -> list[Assignment]:
+            # Fire the page-free API fetches for this class concurrently;
+            # the HTML fallbacks below only run for whichever came back
+            # empty, so the common case never touches the page at all.
+            course_id = self._extract_course_id(cls.url)
+            api_assignments: list[Assignment] | None = None
+            api_announcements: list[Assignment] = []
+            if course_id:
+                api_assignments, api_announcements = await asyncio.gather(
+                    self._fetch_assignments_api(course_id, cls),
+                    self._fetch_news_api(course_id, cls),
+                )
+            cls_page = await page_pool.get()
+            items: list[Assignment] = []
+            async def _scrape_page() -> None:
+                items.extend(await self._scrape_class_assignments(
+                    cls_page, cls, api_assignments=api_assignments
+                ))
+                items.extend(await self._scrape_class_announcements(
+                    cls_page, cls, api_announcements=api_announcements
+                ))
 
-                logger.info(
-                    "Found %d items for '%s'",
-                    len(cls_assignments) + len(announcements), cls.name
+            try:
+                # wait_for rather than asyncio.timeout — the latter would
+                # quietly require Python 3.11
+                await asyncio.wait_for(_scrape_page(), self.CLASS_SCRAPE_TIMEOUT)
+                logger.info("Found %d items for '%s'", len(items), cls.name)
+                return items
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Class '%s' timed out after %ss — keeping %d partial items",
+                    cls.name, self.CLASS_SCRAPE_TIMEOUT, len(items),
                 )
+                return items
             except Exception as e:
                 logger.error("Error scraping Brightspace class '%s': %s", cls.name, e)
+                return items
+            finally:
+                await page_pool.put(cls_page)
+
+        for result in await asyncio.gather(*(_scrape_one(c) for c in self.classes)):
+            for item in result:
+                self._add(item)
+
+        # Close the extra pool pages; keep the original for the passes below
+        while not page_pool.empty():
+            extra = page_pool.get_nowait()
+            if extra is not page:
+                try:
+                    await extra.close()
+                except Exception:
+                    pass
 
-        # Also try the global "Work To Do" widget
-        try:
-            global_todo = await self._scrape_work_to_do(page)
-            # Add items that aren't duplicates
-            existing = {a.title for a in self.assignments}
-            for item in global_todo:
-                if item.title not in existing:
-                    self.assignments.append(item)
-        except Exception as e:
-            logger.debug("Global work-to-do scraping: %s", e)
+        # Also try the global "Work To Do" and calendar widgets (optional —
+        # one navigation back to the homepage and one evaluate for both)
+        if self.include_work_to_do or self.include_upcoming:
+            try:
+                if await self._maybe_goto(page, f"{self.BASE_URL}/d2l/home"):
+                    await self._settle(page)
+                widgets = await self._widget_texts(page)
+                if self.include_work_to_do:
+                    for item in self._parse_work_to_do(widgets.get("work", "")):
+                        self._add(item)
+                if self.include_upcoming:
+                    for item in self._parse_upcoming_events(widgets.get("cal", "")):
+                        self._add(item)
+            except Exception as e:
+                logger.debug("Global widget scraping: %s", e)
 
         return self.classes, self.assignments
 
-    async def _scrape_class_list(self, page: Page) -> list[ClassInfo]:
-        """Scrape the list of enrolled courses from Brightspace homepage."""
-        classes = []
+    async def _scrape_class_list(
+        self, page: Page, api_task: asyncio.Task | None = None
+    ) -> list[ClassInfo]:
+        """Scrape the list of enrolled courses from Brightspace homepage.
+
+        ``api_task`` is the enrollment-API fetch when the caller started it
+        early to overlap with the homepage navigation.
+        """
+        classes: list[ClassInfo] = []
 
         # Brightspace D2L shows courses in various ways:
         # 1. Course cards/tiles on the homepage widget
         # 2. "My Courses" dropdown/panel
         # 3. Full course listing page
 
-        # Method 1: Try the course cards on the homepage
+        # The same course surfaces through these with differently-formatted
+        # URLs (/d2l/home/12345 vs /d2l/le/content/12345/Home), so dedupe
+        # on the org-unit ID rather than the raw URL.
+        seen_ids: set[str] = set()
+
+        def _add_class(c: ClassInfo) -> None:
+            cid = self._extract_course_id(c.url) or c.url
+            if cid in seen_ids:
+                return
+            seen_ids.add(cid)
+            classes.append(c)
+
+        # Method 1: Course cards on the homepage.  The course-link filter
+        # and href dedupe run inside the browser, so the hundreds of
+        # navigation links a busy homepage ships never cross the wire;
+        # org-unit dedupe stays in Python where the API results merge in.
         try:
-            # D2L course cards typically have links to /d2l/home/<courseId>
-            course_links = await page.locator(
-                'a[href*="/d2l/home/"], '
-                'a[href*="/d2l/le/content/"], '
-                'd2l-card a, '
-                '.d2l-card a, '
-                '.course-card a, '
-                'a.d2l-link[href*="/d2l/"]'
-            ).all()
-
-            seen_urls = set()
-            for link in course_links:
-                try:
-                    href = await link.get_attribute("href") or ""
-                    text = (await link.inner_text()).strip()
-
-                    if not text or not href:
-                        continue
-
-                    full_url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
-
-                    if full_url in seen_urls:
-                        continue
-                    seen_urls.add(full_url)
-
-                    # Filter out non-course links
-                    if "/d2l/home/" not in href and "/d2l/le/" not in href:
-                        continue
+            course_links = await page.evaluate(
+                """() => {
+                    const seen = new Set(), out = [];
+                    for (const a of document.querySelectorAll('a[href]')) {
+                        const h = a.getAttribute('href') || '';
+                        if (!h.includes('/d2l/home/') && !h.includes('/d2l/le/')) continue;
+                        if (seen.has(h)) continue;
+                        seen.add(h);
+                        const t = (a.innerText || '').trim();
+                        if (t) out.push({href: h, text: t});
+                    }
+                    return out;
+                }"""
+            )
 
-                    classes.append(ClassInfo(
-                        name=text.split("\n")[0].strip(),
-                        platform=Platform.BRIGHTSPACE,
-                        url=full_url,
-                        short_code=_get_short_code(text, self.semester_classes),
-                    ))
-                except Exception:
-                    continue
+            for link in course_links:
+                href = link["href"]
+                text = link["text"]
+                full_url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
+                _add_class(ClassInfo(
+                    name=text.split("\n", 1)[0].strip(),
+                    platform=Platform.BRIGHTSPACE,
+                    url=full_url,
+                    short_code=self._semester_code(text) or text[:10],
+                ))
         except Exception as e:
             logger.debug("Course cards scraping: %s", e)
 
-        # Method 2: Try the enrollment API endpoint (D2L has REST-like internal APIs)
-        if not classes:
-            classes = await self._scrape_classes_via_api(page)
+        # Method 2: The enrollment API (cheap — cached request, no page),
+        # merged in always since it can surface courses the cards missed
+        if api_task is None:
+            api_task = asyncio.create_task(self._scrape_classes_via_api())
+        for c in await api_task:
+            _add_class(c)
 
-        # Method 3: Try the "My Courses" page
+        # Method 3: The "My Courses" page — costs a navigation, so it stays
+        # a fallback for when the other two found nothing
         if not classes:
-            classes = await self._scrape_my_courses_page(page)
+            for c in await self._scrape_my_courses_page(page):
+                _add_class(c)
 
         return classes
 
-    async def _scrape_classes_via_api(self, page: Page) -> list[ClassInfo]:
-        """Try to get courses from Brightspace's internal API."""
+    async def _scrape_classes_via_api(self) -> list[ClassInfo]:
+        """Try to get courses from Brightspace's internal API.
+
+        Uses the context's request client (session cookies, no page) like
+        the dropbox and news fetches.
+        """
         classes = []
         try:
-            # D2L has internal API endpoints for enrollment
-            response = await page.evaluate("""
-                async () => {
-                    try {
-                        const resp = await fetch('/d2l/api/lp/1.0/enrollments/myenrollments/?sortBy=-PinDate', {
-                            credentials: 'include'
-                        });
-                        if (resp.ok) {
-                            return await resp.json();
-                        }
-                    } catch(e) {}
-                    return null;
-                }
-            """)
+            response = self._cache_get("enrollments", ENROLLMENTS_TTL)
+            if response is None:
+                resp = await self.context.request.get(
+                    f"{self.BASE_URL}/d2l/api/lp/1.0/enrollments/myenrollments/"
+                    "?sortBy=-PinDate"
+                )
+                if resp.ok:
+                    response = _loads(await resp.body())
+                    self._cache_put("enrollments", response)
 
             if response and "Items" in response:
                 for item in response["Items"]:
@@ -229,7 +602,7 @@ class BrightspaceScraper:
                             name=name,
                             platform=Platform.BRIGHTSPACE,
                             url=f"{self.BASE_URL}/d2l/home/{org_id}",
-                            short_code=_get_short_code(name, self.semester_classes),
+                            short_code=self._semester_code(name) or name[:10],
                         ))
         except Exception as e:
             logger.debug("D2L API enrollment fetch: %s", e)
@@ -241,33 +614,31 @@ class BrightspaceScraper:
         try:
             await page.goto(
                 f"{self.BASE_URL}/d2l/le/manageCourses/search/6606",
-                wait_until="load", timeout=30000
+                wait_until="domcontentloaded", timeout=30000
             )
-            await page.wait_for_timeout(2000)
+            await self._settle(page, 'a[href*="/d2l/home/"]')
 
-            links = await page.locator('a[href*="/d2l/home/"]').all()
+            links = await self._extract_links(page, 'a[href*="/d2l/home/"]')
             seen = set()
             for link in links:
-                try:
-                    href = await link.get_attribute("href") or ""
-                    text = (await link.inner_text()).strip()
-                    full_url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
-                    if text and full_url not in seen:
-                        seen.add(full_url)
-                        classes.append(ClassInfo(
-                            name=text.split("\n")[0].strip(),
-                            platform=Platform.BRIGHTSPACE,
-                            url=full_url,
-                            short_code=_get_short_code(text, self.semester_classes),
-                        ))
-                except Exception:
-                    continue
+                href = link["href"]
+                text = link["text"]
+                full_url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
+                if text and full_url not in seen:
+                    seen.add(full_url)
+                    classes.append(ClassInfo(
+                        name=text.split("\n", 1)[0].strip(),
+                        platform=Platform.BRIGHTSPACE,
+                        url=full_url,
+                        short_code=self._semester_code(text) or text[:10],
+                    ))
         except Exception as e:
             logger.debug("My Courses page scraping: %s", e)
         return classes
 
     async def _scrape_class_assignments(
-        self, page: Page, cls: ClassInfo
+        self, page: Page, cls: ClassInfo,
+        api_assignments: list[Assignment] | None = None,
     ) -> list[Assignment]:
         """Scrape assignments for a specific Brightspace class."""
         assignments = []
@@ -278,33 +649,45 @@ class BrightspaceScraper:
             logger.warning("Could not extract course ID for '%s'", cls.name)
             return assignments
 
-        # Method 1: Try D2L API for assignments
-        api_assignments = await self._fetch_assignments_api(page, course_id, cls)
+        # Method 1: Try D2L API for assignments (pre-fetched by the caller
+        # when it already ran the fetch concurrently).  None means the API
+        # couldn't be reached; an empty list means it answered and the
+        # course simply has no dropbox folders.
+        if api_assignments is None:
+            api_assignments = await self._fetch_assignments_api(course_id, cls)
         if api_assignments:
             return api_assignments
 
-        # Method 2: Navigate to the assignments page
-        try:
-            await page.goto(
-                f"{self.BASE_URL}/d2l/lms/dropbox/user/folders_list.d2l?ou={course_id}",
-                wait_until="load", timeout=30000
-            )
-            await page.wait_for_timeout(2000)
-
-            # Parse assignment list
-            rows = await page.locator(
-                'table tr, .d2l-datalist-item, '
-                'div[class*="assignment"], '
-                'a[href*="dropbox"]'
-            ).all()
+        # Method 2: Navigate to the assignments page.  Skipped when the
+        # API answered with an empty folder list — the HTML page would be
+        # empty too, so the navigation is pure cost.
+        if api_assignments is None:
+            try:
+                if await self._maybe_goto(
+                    page,
+                    f"{self.BASE_URL}/d2l/lms/dropbox/user/folders_list.d2l?ou={course_id}",
+                    timeout=30000,
+                ):
+                    await self._settle(page, 'table tr, .d2l-datalist-item')
+
+                # Parse assignment list
+                rows = await self._extract_texts(
+                    page,
+                    'table tr, .d2l-datalist-item, '
+                    'div[class*="assignment"], '
+                    'a[href*="dropbox"]'
+                )
 
-            for row in rows:
-                try:
-                    text = (await row.inner_text()).strip()
+                # Rows are plain strings here, so the parse below can't
+                # raise — cheap guards replace the old per-row try/except
+                # and its exception-object churn
+                for text in rows:
                     if not text or len(text) < 3:
                         continue
 
-                    lines = [l.strip() for l in text.split("\n") if l.strip()]
+                    lines = _split_lines(text)
+                    if not lines:
+                        continue
                     title = lines[0]
 
                     # Skip headers and system rows
@@ -315,21 +698,21 @@ class BrightspaceScraper:
                     due_date = None
                     due_date_str = ""
                     for line in lines:
-                        try:
-                            if re.search(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b', line, re.I):
-                                due_date = dateparser.parse(line, fuzzy=True)
+                        if _MONTH_RE.search(line):
+                            due_date = _parse_date_line(line)
+                            if due_date is not None:
                                 due_date_str = line
                                 break
-                        except Exception:
-                            continue
 
-                    # Determine status
-                    status = AssignmentStatus.NOT_SUBMITTED
-                    text_lower = text.lower()
-                    if "submitted" in text_lower or "completed" in text_lower:
+                    # Determine status — one regex scan instead of four
+                    # substring passes
+                    statuses = set(_STATUS_RE.findall(text.casefold()))
+                    if statuses & {"submitted", "completed"}:
                         continue  # Skip completed
-                    if "overdue" in text_lower or "past due" in text_lower:
-                        status = AssignmentStatus.MISSING
+                    status = (
+                        AssignmentStatus.MISSING if statuses
+                        else AssignmentStatus.NOT_SUBMITTED
+                    )
 
                     assignments.append(Assignment(
                         title=title,
@@ -340,73 +723,68 @@ class BrightspaceScraper:
                         due_date=due_date,
                         due_date_str=due_date_str,
                     ))
-                except Exception:
-                    continue
-        except Exception as e:
-            logger.debug("Assignment page scraping for '%s': %s", cls.name, e)
+            except Exception as e:
+                logger.debug("Assignment page scraping for '%s': %s", cls.name, e)
 
-        # Method 3: Try quizzes page
-        try:
-            quiz_assignments = await self._scrape_quizzes(page, course_id, cls)
-            assignments.extend(quiz_assignments)
-        except Exception:
-            pass
+        # Method 3: Try quizzes page (optional — costs its own navigation)
+        if self.include_quizzes:
+            try:
+                quiz_assignments = await self._scrape_quizzes(page, course_id, cls)
+                assignments.extend(quiz_assignments)
+            except Exception:
+                pass
 
         return assignments
 
     async def _fetch_assignments_api(
-        self, page: Page, course_id: str, cls: ClassInfo
-    ) -> list[Assignment]:
-        """Try fetching assignments via D2L's internal API."""
-        assignments = []
+        self, course_id: str, cls: ClassInfo
+    ) -> list[Assignment] | None:
+        """Try fetching assignments via D2L's internal dropbox API.
+
+        Goes through the context's request client, which reuses the session
+        cookies without needing a page — so callers can run several of
+        these fetches concurrently.
+
+        Returns None when the API couldn't be reached, so callers can tell
+        "this course has no dropbox folders" (an empty list — the HTML page
+        would be empty too) from "the API failed" (worth an HTML fallback).
+        """
         try:
-            response = await page.evaluate(f"""
-                async () => {{
-                    try {{
-                        const resp = await fetch('/d2l/api/le/1.0/{course_id}/content/completions/myProgress/', {{
-                            credentials: 'include'
-                        }});
-                        if (resp.ok) return await resp.json();
-                    }} catch(e) {{}}
-
-                    // Try dropbox (assignments) API
-                    try {{
-                        const resp = await fetch('/d2l/api/le/1.0/{course_id}/dropbox/folders/', {{
-                            credentials: 'include'
-                        }});
-                        if (resp.ok) return {{ type: 'dropbox', data: await resp.json() }};
-                    }} catch(e) {{}}
-
-                    return null;
-                }}
-            """)
-
-            if response:
-                if isinstance(response, dict) and response.get("type") == "dropbox":
-                    for folder in response.get("data", []):
-                        name = folder.get("Name", "")
-                        due = folder.get("DueDate", "")
-                        if name:
-                            due_date = None
-                            if due:
-                                try:
-                                    due_date = dateparser.parse(due)
-                                except Exception:
-                                    pass
-
-                            assignments.append(Assignment(
-                                title=name,
-                                course_name=cls.name,
-                                platform=Platform.BRIGHTSPACE,
-                                item_type=ItemType.ASSIGNMENT,
-                                status=AssignmentStatus.NOT_SUBMITTED,
-                                due_date=due_date,
-                                due_date_str=due or "",
-                            ))
+            data = self._cache_get(f"dropbox:{course_id}", COURSE_DATA_TTL)
+            if data is None:
+                resp = await self.context.request.get(
+                    f"{self.BASE_URL}/d2l/api/le/1.0/{course_id}/dropbox/folders/",
+                    timeout=5000,
+                )
+                if not resp.ok:
+                    return None
+                data = _loads(await resp.body())
+                self._cache_put(f"dropbox:{course_id}", data)
+            def _folder_assignment(folder: dict) -> Assignment:
+                due = folder.get("DueDate", "")
+                due_date = None
+                if due:
+                    try:
+                        due_date = dateparser.parse(due)
+                    except Exception:
+                        pass
+                return Assignment(
+                    title=folder.get("Name", ""),
+                    course_name=cls.name,
+                    platform=Platform.BRIGHTSPACE,
+                    item_type=ItemType.ASSIGNMENT,
+                    status=AssignmentStatus.NOT_SUBMITTED,
+                    due_date=due_date,
+                    due_date_str=due or "",
+                )
+
+            # Build the list in one comprehension rather than per-item appends
+            return [
+                _folder_assignment(f) for f in data if f.get("Name")
+            ]
         except Exception as e:
             logger.debug("D2L API assignment fetch for '%s': %s", cls.name, e)
-
-        return assignments
+            return None
 
     async def _scrape_quizzes(
         self, page: Page, course_id: str, cls: ClassInfo
@@ -414,70 +792,54 @@ class BrightspaceScraper:
         """Scrape quizzes for a course."""
         quizzes = []
         try:
-            await page.goto(
+            if await self._maybe_goto(
+                page,
                 f"{self.BASE_URL}/d2l/lms/quizzing/user/quizzes_list.d2l?ou={course_id}",
-                wait_until="load", timeout=20000
-            )
-            await page.wait_for_timeout(1500)
-
-            rows = await page.locator('table tr, .d2l-datalist-item').all()
-            for row in rows:
-                try:
-                    text = (await row.inner_text()).strip()
-                    if not text or len(text) < 3:
-                        continue
-                    lines = [l.strip() for l in text.split("\n") if l.strip()]
-                    title = lines[0]
-                    if title.lower() in ("name", "quiz", "date", "status"):
-                        continue
+            ):
+                await self._settle(page, 'table tr, .d2l-datalist-item')
 
-                    text_lower = text.lower()
-                    if "completed" in text_lower or "submitted" in text_lower:
-                        continue
+            rows = await self._extract_texts(page, 'table tr, .d2l-datalist-item')
+            for text in rows:
+                if not text or len(text) < 3:
+                    continue
+                lines = _split_lines(text)
+                if not lines:
+                    continue
+                title = lines[0]
+                if title.lower() in ("name", "quiz", "date", "status"):
+                    continue
 
-                    quizzes.append(Assignment(
-                        title=title,
-                        course_name=cls.name,
-                        platform=Platform.BRIGHTSPACE,
-                        item_type=ItemType.QUIZ,
-                        status=AssignmentStatus.NOT_SUBMITTED,
-                    ))
-                except Exception:
+                if set(_STATUS_RE.findall(text.casefold())) & {"submitted", "completed"}:
                     continue
+
+                quizzes.append(Assignment(
+                    title=title,
+                    course_name=cls.name,
+                    platform=Platform.BRIGHTSPACE,
+                    item_type=ItemType.QUIZ,
+                    status=AssignmentStatus.NOT_SUBMITTED,
+                ))
         except Exception as e:
             logger.debug("Quiz scraping for '%s': %s", cls.name, e)
         return quizzes
 
-    async def _scrape_class_announcements(
-        self, page: Page, cls: ClassInfo
+    async def _fetch_news_api(
+        self, course_id: str, cls: ClassInfo
     ) -> list[Assignment]:
-        """Scrape announcements for a Brightspace class.
-
-        The D2L news page (``/d2l/lms/news/main.d2l``) contains a search
-        form and a list of announcements.  We first try the API, then fall
-        back to HTML parsing with a blocklist to avoid scraping form
-        labels like "Show Search Options".
-        """
+        """Fetch announcements via D2L's news API (page-free)."""
         announcements: list[Assignment] = []
-        course_id = self._extract_course_id(cls.url)
-        if not course_id:
-            return announcements
-
-        # ── Try the D2L news API first ──
         try:
-            api_result = await page.evaluate(f"""
-                async () => {{
-                    try {{
-                        const resp = await fetch(
-                            '/d2l/api/le/1.0/{course_id}/news/',
-                            {{ credentials: 'include' }}
-                        );
-                        if (resp.ok) return await resp.json();
-                    }} catch(e) {{}}
-                    return null;
-                }}
-            """)
-            if api_result and isinstance(api_result, list):
+            api_result = self._cache_get(f"news:{course_id}", COURSE_DATA_TTL)
+            if api_result is None:
+                resp = await self.context.request.get(
+                    f"{self.BASE_URL}/d2l/api/le/1.0/{course_id}/news/",
+                    timeout=5000,
+                )
+                if not resp.ok:
+                    return announcements
+                api_result = _loads(await resp.body())
+                self._cache_put(f"news:{course_id}", api_result)
+            if isinstance(api_result, list):
                 for item in api_result[:10]:
                     title = item.get("Title", "").strip()
                     body = (item.get("Body", {}).get("Text", "") or "").strip()
@@ -490,10 +852,32 @@ class BrightspaceScraper:
                             status=AssignmentStatus.ASSIGNED,
                             description=body[:200] if body else "",
                         ))
-                if announcements:
-                    return announcements
         except Exception as e:
             logger.debug("D2L news API for '%s': %s", cls.name, e)
+        return announcements
+
+    async def _scrape_class_announcements(
+        self, page: Page, cls: ClassInfo,
+        api_announcements: list[Assignment] | None = None,
+    ) -> list[Assignment]:
+        """Scrape announcements for a Brightspace class.
+
+        The D2L news page (``/d2l/lms/news/main.d2l``) contains a search
+        form and a list of announcements.  We first try the API, then fall
+        back to HTML parsing with a blocklist to avoid scraping form
+        labels like "Show Search Options".
+        """
+        announcements: list[Assignment] = []
+        course_id = self._extract_course_id(cls.url)
+        if not course_id:
+            return announcements
+
+        # ── Try the D2L news API first (pre-fetched by the caller when it
+        # already ran the fetch concurrently) ──
+        if api_announcements is None:
+            api_announcements = await self._fetch_news_api(course_id, cls)
+        if api_announcements:
+            return api_announcements
 
         # ── Fallback: HTML scraping with strict filtering ──
         # Blocklist of D2L form/UI labels that are NOT announcements
@@ -505,139 +889,116 @@ class BrightspaceScraper:
         }
 
         try:
-            await page.goto(
+            if await self._maybe_goto(
+                page,
                 f"{self.BASE_URL}/d2l/lms/news/main.d2l?ou={course_id}",
-                wait_until="load", timeout=20000,
-            )
-            await page.wait_for_timeout(1500)
+            ):
+                await self._settle(page, '.d2l-datalist-item')
 
             # Target only datalist items (actual announcements)
-            items = await page.locator(".d2l-datalist-item").all()
+            items = await self._extract_texts(page, ".d2l-datalist-item")
             if not items:
                 # Broader fallback — but we'll filter aggressively
-                items = await page.locator(
+                items = await self._extract_texts(
+                    page,
                     'div[class*="news-item"], '
                     'div[class*="d2l-msg-container"]'
-                ).all()
-
-            for item in items[:10]:
-                try:
-                    text = (await item.inner_text()).strip()
-                    if not text or len(text) < 8:
-                        continue
+                )
 
-                    lines = [l.strip() for l in text.split("\n") if l.strip()]
-                    title = lines[0]
+            for text in items[:10]:
+                if not text or len(text) < 8:
+                    continue
 
-                    # Skip if the title is a known UI element
-                    if title.lower().strip() in _UI_JUNK:
-                        continue
-                    # Skip very short titles (likely labels)
-                    if len(title) < 5:
-                        continue
+                lines = _split_lines(text)
+                if not lines:
+                    continue
+                title = lines[0]
 
-                    posted_date_str = ""
-                    for line in lines:
-                        if re.search(
-                            r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b',
-                            line, re.I,
-                        ):
-                            posted_date_str = line
-                            break
-
-                    announcements.append(Assignment(
-                        title=title,
-                        course_name=cls.name,
-                        platform=Platform.BRIGHTSPACE,
-                        item_type=ItemType.ANNOUNCEMENT,
-                        status=AssignmentStatus.ASSIGNED,
-                        posted_date_str=posted_date_str,
-                    ))
-                except Exception:
+                # Skip if the title is a known UI element
+                if title.lower().strip() in _UI_JUNK:
+                    continue
+                # Skip very short titles (likely labels)
+                if len(title) < 5:
                     continue
+
+                posted_date_str = ""
+                for line in lines:
+                    if _MONTH_RE.search(line):
+                        posted_date_str = line
+                        break
+
+                announcements.append(Assignment(
+                    title=title,
+                    course_name=cls.name,
+                    platform=Platform.BRIGHTSPACE,
+                    item_type=ItemType.ANNOUNCEMENT,
+                    status=AssignmentStatus.ASSIGNED,
+                    posted_date_str=posted_date_str,
+                ))
         except Exception as e:
             logger.debug("Announcements scraping for '%s': %s", cls.name, e)
 
         return announcements
 
-    async def _scrape_work_to_do(self, page: Page) -> list[Assignment]:
-        """Scrape the global 'Work To Do' widget on the Brightspace homepage."""
-        items = []
+    async def _widget_texts(self, page: Page) -> dict:
+        """Grab the Work To Do and calendar widget texts in one evaluate.
+
+        ``:has-text`` is Playwright-only, so the in-page lookup walks
+        widget-shaped containers and text-matches their contents.
+        """
         try:
-            await page.goto(f"{self.BASE_URL}/d2l/home", wait_until="load", timeout=20000)
-            await page.wait_for_timeout(2000)
-
-            # Look for "Work To Do" widget
-            widget = page.locator(
-                'div:has-text("Work To Do"), '
-                'd2l-widget:has-text("Work To Do"), '
-                'section:has-text("Work To Do")'
+            return await page.evaluate(
+                """() => {
+                    const findByText = (needle) => {
+                        const els = document.querySelectorAll(
+                            'd2l-widget, section, div[class*="widget"], div[class*="calendar"]'
+                        );
+                        for (const el of els) {
+                            if ((el.innerText || '').toLowerCase().includes(needle))
+                                return el.innerText.trim();
+                        }
+                        return '';
+                    };
+                    return {
+                        work: findByText('work to do'),
+                        cal: findByText('upcoming events') || findByText('calendar'),
+                    };
+                }"""
             )
-
-            if await widget.count() > 0:
-                widget_el = widget.first
-                text = (await widget_el.inner_text()).strip()
-                lines = [l.strip() for l in text.split("\n") if l.strip()]
-
-                for line in lines:
-                    if line.lower() in ("work to do", "upcoming", ""):
-                        continue
-                    items.append(Assignment(
-                        title=line,
-                        course_name="",
-                        platform=Platform.BRIGHTSPACE,
-                        item_type=ItemType.ASSIGNMENT,
-                        status=AssignmentStatus.NOT_SUBMITTED,
-                    ))
-
-            # Also try the calendar/upcoming events
-            upcoming = await self._scrape_upcoming_events(page)
-            items.extend(upcoming)
-
         except Exception as e:
-            logger.debug("Work To Do scraping: %s", e)
+            logger.debug("Widget text extract: %s", e)
+            return {"work": "", "cal": ""}
+
+    def _parse_work_to_do(self, text: str) -> list[Assignment]:
+        """Parse the 'Work To Do' widget text into assignment items."""
+        items = []
+        for line in _split_lines(text):
+            if line.lower() in ("work to do", "upcoming", ""):
+                continue
+            items.append(Assignment(
+                title=line,
+                course_name="",
+                platform=Platform.BRIGHTSPACE,
+                item_type=ItemType.ASSIGNMENT,
+                status=AssignmentStatus.NOT_SUBMITTED,
+            ))
         return items
 
-    async def _scrape_upcoming_events(self, page: Page) -> list[Assignment]:
-        """Scrape upcoming events from the Brightspace calendar widget."""
+    def _parse_upcoming_events(self, text: str) -> list[Assignment]:
+        """Parse the calendar widget text into upcoming-event items."""
         events = []
-        try:
-            # Look for calendar or upcoming events widget
-            calendar_widget = page.locator(
-                'div:has-text("Upcoming Events"), '
-                'd2l-widget:has-text("Calendar"), '
-                'div[class*="calendar"]'
-            )
-
-            if await calendar_widget.count() > 0:
-                text = (await calendar_widget.first.inner_text()).strip()
-                lines = [l.strip() for l in text.split("\n") if l.strip()]
-
-                for line in lines:
-                    if line.lower() in ("upcoming events", "calendar", ""):
-                        continue
-                    events.append(Assignment(
-                        title=line,
-                        course_name="",
-                        platform=Platform.BRIGHTSPACE,
-                        item_type=ItemType.EVENT,
-                        status=AssignmentStatus.UPCOMING,
-                    ))
-        except Exception as e:
-            logger.debug("Upcoming events scraping: %s", e)
+        for line in _split_lines(text):
+            if line.lower() in ("upcoming events", "calendar", ""):
+                continue
+            events.append(Assignment(
+                title=line,
+                course_name="",
+                platform=Platform.BRIGHTSPACE,
+                item_type=ItemType.EVENT,
+                status=AssignmentStatus.UPCOMING,
+            ))
         return events
 
     def _extract_course_id(self, url: str) -> str:
         """Extract the course/org unit ID from a Brightspace URL."""
-        # URLs are like /d2l/home/12345 or ?ou=12345
-        match = re.search(r'/d2l/home/(\d+)', url)
-        if match:
-            return match.group(1)
-        match = re.search(r'ou=(\d+)', url)
-        if match:
-            return match.group(1)
-        # Try just the last numeric segment
-        match = re.search(r'/(\d+)/?$', url)
-        if match:
-            return match.group(1)
-        return ""
+        return _course_id_from_url(url)
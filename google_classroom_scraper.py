@@ -7,6 +7,7 @@ to interact with it.
 """
 
 import asyncio
+import functools
 import logging
 import os
 import re
@@ -27,25 +28,31 @@ SCREENSHOT_DIR = os.path.join(os.path.dirname(__file__), "debug_screenshots")
 # Default semester classes (overridden by .env / constructor arg)
 DEFAULT_SEMESTER_CLASSES = ["ENG", "GLE", "PPL", "History"]
 
+# Compiled once at import — these run once per link/item in the loops below
+_COURSE_ID_RE = re.compile(r"/c/([^/]+)")
+# aria-label looks like: 'Assignment: "Planning Log"'
+_ARIA_ITEM_RE = re.compile(r'(Assignment|Quiz|Material|Question):\s*"(.+)"')
+_DUE_RE = re.compile(r"due\s+(.+)", re.IGNORECASE)
+_SP_SUFFIX_RE = re.compile(r"/sp/.+$")
+# Raw-HTML fallback patterns — narrow anchors with no dot-star padding,
+# so scanning a multi-MB page stays a single linear pass
+_HTML_COURSE_LINK_RE = re.compile(r'href="(/c/[^"]+)"[^>]*>([^<]+)')
+_HTML_ASSIGNMENT_LINK_RE = re.compile(r'href="(/c/[^/]+/(?:a|sa)/[^"]+)"[^>]*>([^<]+)')
 
-def _matches_semester_class(class_name: str, semester_classes: list[str] | None = None) -> bool:
-    """Check if a class name matches one of the semester courses."""
-    classes = semester_classes or DEFAULT_SEMESTER_CLASSES
-    name_upper = class_name.upper()
-    for code in classes:
-        if code.upper() in name_upper:
-            return True
-    return False
 
+@functools.lru_cache(maxsize=1024)
+def _parse_due(raw: str) -> Optional[datetime]:
+    """Parse a due-date string, cached — the same date repeats across items."""
+    try:
+        return dateparser.parse(raw, fuzzy=True)
+    except Exception:
+        return None
 
-def _get_short_code(class_name: str, semester_classes: list[str] | None = None) -> str:
-    """Extract a short code from the class name."""
-    classes = semester_classes or DEFAULT_SEMESTER_CLASSES
-    name_upper = class_name.upper()
-    for code in classes:
-        if code.upper() in name_upper:
-            return code.upper()
-    return class_name[:10]
+
+def _is_class_level_url(url: str, cid: str) -> bool:
+    """True if a /c/ URL points at the class page itself, not a sub-link."""
+    path = url.split("?", 1)[0].rstrip("/")
+    return path.endswith(f"/c/{cid}") or path.endswith(f"/c/{cid}/sp")
 
 
 class GoogleClassroomScraper:
@@ -53,12 +60,32 @@ class GoogleClassroomScraper:
 
     BASE_URL = "https://classroom.google.com"
 
+    # Pages used for concurrent per-class scraping — same sizing rationale
+    # as the Brightspace scraper: each class is dominated by navigation
+    # latency, so a few pages give a near-linear speedup.
+    CLASS_PAGE_POOL_SIZE = 4
+
     def __init__(self, context: BrowserContext, semester_classes: list[str] | None = None):
         self.semester_classes = semester_classes or DEFAULT_SEMESTER_CLASSES
+        # Upper-cased codes computed once for matching; per-name lookups
+        # are memoized since the same class name is probed for every
+        # scraped item.  The original-cased code is what gets returned —
+        # it doubles as a course name (e.g. "History", not "HISTORY").
+        self._code_pairs = [(c, c.upper()) for c in self.semester_classes]
+        self._match_cache: dict[str, str | None] = {}
         self.context = context
         self.classes: list[ClassInfo] = []
         self.assignments: list[Assignment] = []
 
+    def _semester_code(self, class_name: str) -> str | None:
+        """Return the semester code matching a class name, or None (cached)."""
+        if class_name not in self._match_cache:
+            name_upper = class_name.upper()
+            self._match_cache[class_name] = next(
+                (orig for orig, up in self._code_pairs if up in name_upper), None
+            )
+        return self._match_cache[class_name]
+
     async def scrape_all(self) -> tuple[list[ClassInfo], list[Assignment]]:
         """Main entry: scrape classes then assignments for each matching class."""
         page = self.context.pages[0] if self.context.pages else await self.context.new_page()
@@ -74,13 +101,15 @@ class GoogleClassroomScraper:
             logger.warning("Timed out waiting for class card links — proceeding anyway")
 
         # Let remaining cards finish rendering
-        await page.wait_for_timeout(5000)
+        await self._settle(page)
 
-        # Always save a screenshot of the class list page for diagnostics
+        # Always save a screenshot of the class list page for diagnostics.
+        # Viewport-only JPEG — full_page forces a scroll-stitch of the whole
+        # document, and the class cards we care about fit the viewport.
         os.makedirs(SCREENSHOT_DIR, exist_ok=True)
         try:
-            ss_path = os.path.join(SCREENSHOT_DIR, "gc_class_list.png")
-            await page.screenshot(path=ss_path, full_page=True)
+            ss_path = os.path.join(SCREENSHOT_DIR, "gc_class_list.jpg")
+            await page.screenshot(path=ss_path, type="jpeg", quality=60)
             print(f"  [debug] Screenshot saved: {ss_path}")
         except Exception as e:
             print(f"  [debug] Screenshot failed: {e}")
@@ -92,7 +121,7 @@ class GoogleClassroomScraper:
             print(f"    - '{c.name}'  (url={c.url})")
 
         # Filter to semester classes
-        self.classes = [c for c in all_classes if _matches_semester_class(c.name, self.semester_classes)]
+        self.classes = [c for c in all_classes if self._semester_code(c.name) is not None]
         print(f"  [debug] Matched {len(self.classes)} semester classes (filter={self.semester_classes}):")
         for c in self.classes:
             print(f"    - '{c.name}'")
@@ -102,20 +131,60 @@ class GoogleClassroomScraper:
             logger.warning("No semester class matches found, using all classes")
             self.classes = all_classes
 
-        # Scrape assignments for each class
-        for cls in self.classes:
+        # Scrape classes concurrently on a small pool of pages.  Each task
+        # checks a page out of the queue and returns it when done, so at
+        # most CLASS_PAGE_POOL_SIZE navigations are in flight at once.
+        # Results are collected per class and merged at the end to avoid
+        # interleaved mutation of self.assignments.
+        page_pool: asyncio.Queue[Page] = asyncio.Queue()
+        await page_pool.put(page)
+        for _ in range(min(self.CLASS_PAGE_POOL_SIZE, max(len(self.classes), 1)) - 1):
+            await page_pool.put(await self.context.new_page())
+
+        async def _scrape_one(cls: ClassInfo) -> list[Assignment]:
+            cls_page = await page_pool.get()
             try:
-                class_assignments = await self._scrape_class_assignments(page, cls)
-                self.assignments.extend(class_assignments)
-                logger.info(
-                    "Found %d items for '%s'",
-                    len(class_assignments), cls.name
-                )
+                items = await self._scrape_class_assignments(cls_page, cls)
+                logger.info("Found %d items for '%s'", len(items), cls.name)
+                return items
             except Exception as e:
                 logger.error("Error scraping class '%s': %s", cls.name, e)
+                return []
+            finally:
+                await page_pool.put(cls_page)
+
+        for result in await asyncio.gather(*(_scrape_one(c) for c in self.classes)):
+            self.assignments.extend(result)
+
+        # Close the extra pool pages; keep the original for later passes
+        while not page_pool.empty():
+            extra = page_pool.get_nowait()
+            if extra is not page:
+                try:
+                    await extra.close()
+                except Exception:
+                    pass
 
         return self.classes, self.assignments
 
+    async def _settle(self, page: Page, selector: str | None = None, timeout: int = 5000):
+        """Wait for the page to quiet down instead of sleeping a fixed pad.
+
+        Classroom keeps rendering after domcontentloaded, so wait for the
+        network to go idle and then (optionally) for the first element the
+        caller wants to parse.  Both waits are tolerant — a chatty page or
+        an empty list just falls through at the timeout.
+        """
+        try:
+            await page.wait_for_load_state("networkidle", timeout=timeout)
+        except Exception:
+            pass
+        if selector:
+            try:
+                await page.locator(selector).first.wait_for(timeout=3000)
+            except Exception:
+                pass
+
     async def _scroll_to_load_all(self, page: Page, max_scrolls: int = 10):
         """Scroll the page to the bottom to trigger lazy-loaded content."""
         for _ in range(max_scrolls):
@@ -129,6 +198,25 @@ class GoogleClassroomScraper:
         await page.evaluate("window.scrollTo(0, 0)")
         await page.wait_for_timeout(500)
 
+    async def _extract_links(self, page: Page, selector: str) -> list[dict]:
+        """Pull ``{href, text}`` for every match in one evaluate call.
+
+        A locator loop costs two round-trips per element (get_attribute +
+        inner_text); batching the whole list into a single evaluate keeps
+        the per-link work in plain Python.
+        """
+        try:
+            return await page.evaluate(
+                """(sel) => Array.from(document.querySelectorAll(sel)).map(a => ({
+                    href: a.getAttribute('href') || '',
+                    text: (a.innerText || a.textContent || '').trim(),
+                }))""",
+                selector,
+            )
+        except Exception as e:
+            logger.debug("Batch link extract: %s", e)
+            return []
+
     async def _scrape_class_list(self, page: Page) -> list[ClassInfo]:
         """Scrape the list of classes from the Google Classroom homepage.
 
@@ -143,31 +231,25 @@ class GoogleClassroomScraper:
         We group all links by their course ID (from the URL) and pick the
         best text for each unique course.
         """
-        # ── Collect every /c/ link ──
-        links = await page.locator('a[href*="/c/"]').all()
+        # ── Collect every /c/ link in one evaluate ──
+        links = await self._extract_links(page, 'a[href*="/c/"]')
 
         # Map courseId → list of (full_url, raw_text)
         course_texts: dict[str, list[tuple[str, str]]] = {}
         for link in links:
-            try:
-                href = await link.get_attribute("href") or ""
-                # Try inner_text first, fall back to textContent
-                text = (await link.inner_text()).strip()
-                if not text:
-                    text = (await link.text_content() or "").strip()
-                if not text or "/c/" not in href:
-                    continue
-                # Normalise URL
-                if href.startswith("/"):
-                    href = f"{self.BASE_URL}{href}"
-                # Extract course id segment (/c/<id> or /c/<id>/…)
-                match = re.search(r"/c/([^/]+)", href)
-                if not match:
-                    continue
-                cid = match.group(1)
-                course_texts.setdefault(cid, []).append((href, text))
-            except Exception as e:
-                logger.debug("Error reading class link: %s", e)
+            href = link["href"]
+            text = link["text"]
+            if not text or "/c/" not in href:
+                continue
+            # Normalise URL
+            if href.startswith("/"):
+                href = f"{self.BASE_URL}{href}"
+            # Extract course id segment (/c/<id> or /c/<id>/…)
+            match = _COURSE_ID_RE.search(href)
+            if not match:
+                continue
+            cid = match.group(1)
+            course_texts.setdefault(cid, []).append((href, text))
 
         # Debug: dump all raw course texts
         for cid, entries in course_texts.items():
@@ -182,15 +264,14 @@ class GoogleClassroomScraper:
             # Separate class-level links from assignment/sub-links
             class_links = [
                 (url, txt) for url, txt in entries
-                if re.fullmatch(rf".*?/c/{re.escape(cid)}/?(\?.*)?$", url)
-                or re.fullmatch(rf".*?/c/{re.escape(cid)}/sp/?(\?.*)?$", url)
+                if _is_class_level_url(url, cid)
             ]
             # Among class-level links, pick the longest text
             pool = class_links if class_links else entries
             pool.sort(key=lambda e: len(e[1]), reverse=True)
             best_url, best_text = pool[0]
             # Strip the URL down to the class page (no /sp/… suffix)
-            class_url = re.sub(r"/sp/.+$", "", best_url)
+            class_url = _SP_SUFFIX_RE.sub("", best_url)
 
             # Parse name: skip any single-char first line (icon letter)
             lines = [ln.strip() for ln in best_text.split("\n") if ln.strip()]
@@ -206,7 +287,7 @@ class GoogleClassroomScraper:
                 platform=Platform.GOOGLE_CLASSROOM,
                 url=class_url,
                 teacher=section,  # section code in "teacher" field for display
-                short_code=_get_short_code(name, self.semester_classes),
+                short_code=self._semester_code(name) or name[:10],
             ))
 
         # Fallback: try to get classes from the page content
@@ -221,20 +302,19 @@ class GoogleClassroomScraper:
         try:
             # Try getting all major clickable elements that look like courses
             # Google Classroom uses various selectors across versions
-            all_links = await page.locator('a[data-courseid], a[href*="classroom.google.com/c/"]').all()
+            all_links = await self._extract_links(
+                page, 'a[data-courseid], a[href*="classroom.google.com/c/"]'
+            )
             for link in all_links:
-                try:
-                    href = await link.get_attribute("href") or ""
-                    text = (await link.inner_text()).strip()
-                    if text:
-                        classes.append(ClassInfo(
-                            name=text.split("\n")[0].strip(),
-                            platform=Platform.GOOGLE_CLASSROOM,
-                            url=href if href.startswith("http") else f"{self.BASE_URL}{href}",
-                            short_code=_get_short_code(text, self.semester_classes),
-                        ))
-                except Exception:
-                    continue
+                href = link["href"]
+                text = link["text"]
+                if text:
+                    classes.append(ClassInfo(
+                        name=text.split("\n")[0].strip(),
+                        platform=Platform.GOOGLE_CLASSROOM,
+                        url=href if href.startswith("http") else f"{self.BASE_URL}{href}",
+                        short_code=self._semester_code(text) or text[:10],
+                    ))
         except Exception as e:
             logger.debug("Fallback class scraping failed: %s", e)
 
@@ -242,17 +322,17 @@ class GoogleClassroomScraper:
         if not classes:
             try:
                 content = await page.content()
-                # Look for course links in HTML
-                course_pattern = r'href="(/c/[^"]+)"[^>]*>([^<]+)'
-                matches = re.findall(course_pattern, content)
-                for href, name in matches:
+                # Look for course links in HTML — finditer keeps the scan
+                # lazy instead of materializing every match up front
+                for m in _HTML_COURSE_LINK_RE.finditer(content):
+                    href, name = m.group(1), m.group(2)
                     name = name.strip()
                     if name:
                         classes.append(ClassInfo(
                             name=name,
                             platform=Platform.GOOGLE_CLASSROOM,
                             url=f"{self.BASE_URL}{href}",
-                            short_code=_get_short_code(name, self.semester_classes),
+                            short_code=self._semester_code(name) or name[:10],
                         ))
             except Exception as e:
                 logger.debug("HTML fallback failed: %s", e)
@@ -266,8 +346,8 @@ class GoogleClassroomScraper:
         assignments: list[Assignment] = []
 
         # Navigate to the class page
-        await page.goto(cls.url, wait_until="load", timeout=30000)
-        await page.wait_for_timeout(2000)
+        await page.goto(cls.url, wait_until="domcontentloaded", timeout=30000)
+        await self._settle(page)
 
         # The Classwork tab already uses data-stream-item-id containers
         # which capture assignments, quizzes, etc.
@@ -301,15 +381,15 @@ class GoogleClassroomScraper:
             )
             if await classwork_tab.count() > 0:
                 await classwork_tab.first.click()
-                await page.wait_for_load_state("load", timeout=15000)
-                await page.wait_for_timeout(2000)
+                await page.wait_for_load_state("domcontentloaded", timeout=15000)
             else:
                 class_id = cls.url.rstrip("/").split("/")[-1]
                 await page.goto(
                     f"{self.BASE_URL}/c/{class_id}/a/not-turned-in/all",
-                    wait_until="load", timeout=30000,
+                    wait_until="domcontentloaded", timeout=30000,
                 )
-                await page.wait_for_timeout(2000)
+            # Wait for the stream items the parser below actually reads
+            await self._settle(page, "div[data-stream-item-id][data-stream-item-type]")
         except Exception as e:
             logger.debug("Could not navigate to Classwork for '%s': %s", cls.name, e)
             return assignments
@@ -349,8 +429,7 @@ class GoogleClassroomScraper:
         if await link.count() > 0:
             aria = (await link.first.get_attribute("aria-label")) or ""
             href = (await link.first.get_attribute("href")) or ""
-            # aria-label looks like: 'Assignment: "Planning Log"'
-            m = re.match(r'(Assignment|Quiz|Material|Question):\s*"(.+)"', aria)
+            m = _ARIA_ITEM_RE.match(aria)
             if m:
                 kind, title = m.group(1), m.group(2)
                 kind_lower = kind.lower()
@@ -381,12 +460,9 @@ class GoogleClassroomScraper:
         if await due_loc.count() > 0:
             raw = (await due_loc.first.inner_text()).strip()
             due_date_str = raw
-            m = re.search(r"(?:due|Due)\s+(.+)", raw, re.IGNORECASE)
+            m = _DUE_RE.search(raw)
             if m:
-                try:
-                    due_date = dateparser.parse(m.group(1), fuzzy=True)
-                except Exception:
-                    pass
+                due_date = _parse_due(m.group(1))
 
         # 4. Determine status from surrounding text
         full_text = (await container.inner_text()).strip().lower()
@@ -422,10 +498,8 @@ class GoogleClassroomScraper:
             content = await page.content()
             # Look for assignment-like elements
             # Google Classroom embeds assignment data in specific patterns
-            assignment_pattern = r'href="(/c/[^/]+/(?:a|sa)/[^"]+)"[^>]*>([^<]+)'
-            matches = re.findall(assignment_pattern, content)
-
-            for href, title in matches:
+            for m in _HTML_ASSIGNMENT_LINK_RE.finditer(content):
+                href, title = m.group(1), m.group(2)
                 title = title.strip()
                 if title and len(title) > 2:
                     assignments.append(Assignment(
@@ -455,9 +529,9 @@ class GoogleClassroomScraper:
         try:
             await page.goto(
                 f"{self.BASE_URL}/u/0/a/not-turned-in/all",
-                wait_until="load", timeout=30000,
+                wait_until="domcontentloaded", timeout=30000,
             )
-            await page.wait_for_timeout(3000)
+            await self._settle(page, "div[data-stream-item-id]")
 
             body_text = await page.inner_text("body")
             if "nothing on your to-do list" in body_text.lower():
@@ -479,33 +553,32 @@ class GoogleClassroomScraper:
                     except Exception as e:
                         logger.debug("Error parsing global stream item: %s", e)
             else:
-                # Fallback: look for detail links only (not nav links)
-                detail_links = await page.locator(
-                    'a[href*="/details"]'
-                ).all()
+                # Fallback: look for detail links only (not nav links) —
+                # aria-label and href for all of them in one evaluate
+                detail_links = await page.evaluate(
+                    """() => Array.from(
+                        document.querySelectorAll('a[href*="/details"]')
+                    ).map(a => ({
+                        aria: a.getAttribute('aria-label') || '',
+                        href: a.getAttribute('href') || '',
+                    }))"""
+                )
                 for link in detail_links:
-                    try:
-                        aria = (await link.get_attribute("aria-label")) or ""
-                        href = (await link.get_attribute("href")) or ""
-                        m = re.match(
-                            r'(Assignment|Quiz|Material|Question):\s*"(.+)"',
-                            aria,
+                    m = _ARIA_ITEM_RE.match(link["aria"])
+                    if m:
+                        title = m.group(2)
+                        href = link["href"]
+                        url = (
+                            href if href.startswith("http")
+                            else f"{self.BASE_URL}{href}"
                         )
-                        if m:
-                            title = m.group(2)
-                            url = (
-                                href if href.startswith("http")
-                                else f"{self.BASE_URL}{href}"
-                            )
-                            items.append(Assignment(
-                                title=title,
-                                course_name="Unknown Class",
-                                platform=Platform.GOOGLE_CLASSROOM,
-                                status=AssignmentStatus.NOT_SUBMITTED,
-                                url=url,
-                            ))
-                    except Exception:
-                        continue
+                        items.append(Assignment(
+                            title=title,
+                            course_name="Unknown Class",
+                            platform=Platform.GOOGLE_CLASSROOM,
+                            status=AssignmentStatus.NOT_SUBMITTED,
+                            url=url,
+                        ))
 
         except Exception as e:
             logger.error("Global to-do scraping error: %s", e)
@@ -522,7 +595,7 @@ class GoogleClassroomScraper:
         if await link.count() > 0:
             aria = (await link.first.get_attribute("aria-label")) or ""
             href = (await link.first.get_attribute("href")) or ""
-            m = re.match(r'(Assignment|Quiz|Material|Question):\s*"(.+)"', aria)
+            m = _ARIA_ITEM_RE.match(aria)
             if m:
                 kind, title = m.group(1), m.group(2)
                 if "quiz" in kind.lower() or "question" in kind.lower():
@@ -541,12 +614,8 @@ class GoogleClassroomScraper:
             return None
 
         # Course name — sometimes in a secondary line
-        course_name = "Unknown Class"
         full_text = (await container.inner_text()).strip()
-        for code in self.semester_classes:
-            if code.upper() in full_text.upper():
-                course_name = code
-                break
+        course_name = self._semester_code(full_text) or "Unknown Class"
 
         # Due date
         due_date = None
@@ -555,12 +624,9 @@ class GoogleClassroomScraper:
         if await due_loc.count() > 0:
             raw = (await due_loc.first.inner_text()).strip()
             due_date_str = raw
-            m = re.search(r"(?:due|Due)\s+(.+)", raw, re.IGNORECASE)
+            m = _DUE_RE.search(raw)
             if m:
-                try:
-                    due_date = dateparser.parse(m.group(1), fuzzy=True)
-                except Exception:
-                    pass
+                due_date = _parse_due(m.group(1))
 
         url = href if href.startswith("http") else (
             f"{self.BASE_URL}{href}" if href else ""
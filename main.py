@@ -293,6 +293,7 @@ async def run(
     headless: bool = False,
     debug: bool = False,
     semester_classes: list[str] | None = None,
+    use_cache: bool = True,
 ):
     """Main async workflow."""
     auth = TDSBAuth(username, password, debug=debug)
@@ -300,18 +301,26 @@ async def run(
     gc_classes: list[ClassInfo] = []
     bs_classes: list[ClassInfo] = []
     all_assignments: list[Assignment] = []
+    gc_login_task: asyncio.Task | None = None
+    bs_login_task: asyncio.Task | None = None
 
     try:
         # Start browser
         with console.status("[bold cyan]Launching browser...[/bold cyan]"):
             await auth.start_browser(headless=headless)
 
-        # ── Google Classroom ────────────────────────────────────────
+        # ── Logins (both platforms concurrently) ────────────────────
+        # Each login builds its own BrowserContext on the shared browser,
+        # so the two SSO flows are independent and can run in parallel.
         console.print()
-        console.print("[bold green]▶ Logging into Google Classroom...[/bold green]")
+        console.print("[bold cyan]▶ Logging into Google Classroom and Brightspace...[/bold cyan]")
+        gc_login_task = asyncio.create_task(auth.login_google_classroom())
+        bs_login_task = asyncio.create_task(auth.login_brightspace())
+
+        # ── Google Classroom ────────────────────────────────────────
         try:
             with console.status("[bold green]Authenticating with TDSB SSO for Google Classroom...[/bold green]"):
-                gc_context = await auth.login_google_classroom()
+                gc_context = await gc_login_task
 
             console.print("[green]✓ Google Classroom login successful[/green]")
 
@@ -322,9 +331,12 @@ async def run(
                 # Also try the global to-do
                 try:
                     global_todo = await gc_scraper.scrape_global_todo()
-                    existing_titles = {a.title for a in gc_assignments}
+                    # Maintained incrementally — O(1) per item, and dupes
+                    # within the to-do list itself are dropped too
+                    seen_titles = {a.title for a in gc_assignments}
                     for item in global_todo:
-                        if item.title not in existing_titles:
+                        if item.title not in seen_titles:
+                            seen_titles.add(item.title)
                             gc_assignments.append(item)
                 except Exception:
                     pass
@@ -345,15 +357,17 @@ async def run(
 
         # ── Brightspace ─────────────────────────────────────────────
         console.print()
-        console.print("[bold blue]▶ Logging into Brightspace...[/bold blue]")
         try:
             with console.status("[bold blue]Authenticating with TDSB SSO for Brightspace...[/bold blue]"):
-                bs_context = await auth.login_brightspace()
+                bs_context = await bs_login_task
 
             console.print("[blue]✓ Brightspace login successful[/blue]")
 
             with console.status("[bold blue]Scraping Brightspace...[/bold blue]"):
-                bs_scraper = BrightspaceScraper(bs_context, semester_classes=semester_classes)
+                bs_scraper = BrightspaceScraper(
+                    bs_context, semester_classes=semester_classes,
+                    username=username, use_cache=use_cache,
+                )
                 bs_classes, bs_assignments = await bs_scraper.scrape_all()
 
             all_assignments.extend(bs_assignments)
@@ -379,6 +393,14 @@ async def run(
         if debug:
             console.print_exception()
     finally:
+        # Don't tear the contexts down under a still-running login — on an
+        # early exit (fatal error, Ctrl-C) cancel and await both tasks so
+        # nothing is left pending with its exception unretrieved.
+        login_tasks = [t for t in (gc_login_task, bs_login_task) if t is not None]
+        for task in login_tasks:
+            task.cancel()
+        if login_tasks:
+            await asyncio.gather(*login_tasks, return_exceptions=True)
         with console.status("[dim]Closing browser...[/dim]"):
             await auth.close()
         console.print("[dim]Done.[/dim]")
@@ -398,6 +420,11 @@ def main():
         action="store_true",
         help="Enable debug logging",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached Brightspace API responses and fetch fresh data",
+    )
     parser.add_argument(
         "--username",
         type=str,
@@ -444,6 +471,7 @@ def main():
         username, password,
         headless=headless, debug=args.debug,
         semester_classes=semester_classes,
+        use_cache=not args.no_cache,
     ))
 
 
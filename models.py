@@ -31,7 +31,7 @@ class ItemType(Enum):
     EVENT = "Event"
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassInfo:
     """Represents a class/course."""
     name: str
@@ -41,7 +41,7 @@ class ClassInfo:
     short_code: str = ""  # e.g. ENG, GLE, PPL, History
 
 
-@dataclass
+@dataclass(slots=True)
 class Assignment:
     """Represents an assignment or work item."""
     title: str